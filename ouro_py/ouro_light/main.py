@@ -18,6 +18,7 @@ import uuid
 import time
 import logging
 import aiohttp
+import orjson
 from aiohttp import web
 
 # Fix Windows asyncio: ProactorEventLoop raises ConnectionResetError [WinError 10054]
@@ -28,6 +29,32 @@ if sys.platform == "win32":
 logging.basicConfig(level=logging.INFO, format="[LightNode] %(message)s")
 log = logging.getLogger("light")
 
+# Heavy/aggregator hosts rarely change address; cache lookups across poll cycles
+DNS_CACHE_TTL = 300
+
+
+def make_resolver():
+    """Use the c-ares resolver when aiodns is installed, else the threaded default."""
+    try:
+        return aiohttp.AsyncResolver()
+    except RuntimeError:
+        return aiohttp.ThreadedResolver()
+
+
+def json_response(data, status: int = 200) -> web.Response:
+    """web.json_response equivalent that encodes with orjson."""
+    return web.Response(body=orjson.dumps(data), status=status, content_type="application/json")
+
+
+def json_prefix(static: dict) -> bytes:
+    """Encode fields that never change as an open JSON object, ready to extend."""
+    return orjson.dumps(static)[:-1] + b","
+
+
+def prefixed_json_response(prefix: bytes, dynamic: dict) -> web.Response:
+    """Complete a json_prefix() body with the per-request fields."""
+    return web.Response(body=prefix + orjson.dumps(dynamic)[1:], content_type="application/json")
+
 
 # ─── Auth Middleware ────────────────────────────────────────────────
 
@@ -54,14 +81,14 @@ async def auth_middleware(request, handler):
 
     auth_header = request.headers.get("Authorization", "")
     if not auth_header.startswith("Bearer "):
-        return web.json_response(
+        return json_response(
             {"error": "Missing or invalid Authorization header. Use: Bearer <api_key>"},
             status=401,
         )
 
     token = auth_header[7:].strip()
     if token not in api_keys:
-        return web.json_response({"error": "Invalid API key"}, status=403)
+        return json_response({"error": "Invalid API key"}, status=403)
 
     return await handler(request)
 
@@ -73,7 +100,12 @@ class LightNode:
         self.node_id = node_id
         self.api_port = api_port
         self.role = "light"
-        self.start_time = time.time()
+        self._start_mono = time.monotonic()
+
+        # Clock cache shared by request handlers, refreshed by _tick()
+        self._now_s = int(time.time())
+        self._uptime_s = 0
+
         self.microchain_id = f"micro-{node_id[:8]}"
         self.heavy_addr = os.getenv("HEAVY_ADDR", "http://localhost:8000")
         self.aggregator_addr = os.getenv("AGGREGATOR_ADDR", "")
@@ -86,151 +118,160 @@ class LightNode:
         self.tx_submitted = 0
         self.last_sync_time = 0
 
-    async def get_identity(self, request):
-        uptime = int(time.time() - self.start_time)
-        return web.json_response({
+        # Parsed once; outbound calls authenticate with the first key
+        self._api_keys = load_api_keys()
+        self._outbound_headers = (
+            {"Authorization": f"Bearer {next(iter(self._api_keys))}"} if self._api_keys else {}
+        )
+        self._json_headers = {**self._outbound_headers, "Content-Type": "application/json"}
+
+        # Shared outbound HTTP session (created in run())
+        self._session: aiohttp.ClientSession | None = None
+
+        # Constant fields of /identity and /health, encoded once
+        self._identity_prefix = json_prefix({
             "node_id": self.node_id,
             "role": self.role,
             "public_name": f"AppNode-{self.node_id[:8]}",
             "microchain_id": self.microchain_id,
-            "total_uptime_secs": uptime,
             "difficulty": "small",
             "version": "0.2.0-py",
+        })
+        self._health_prefix = json_prefix({
+            "status": "ok",
+            "node_name": f"AppNode-{self.node_id[:8]}",
+        })
+
+    async def get_identity(self, request):
+        uptime = self._uptime_s
+        return prefixed_json_response(self._identity_prefix, {
+            "total_uptime_secs": uptime,
             "synced_height": self.synced_block_height,
             "aggregator": self.aggregator_addr or "none",
         })
 
     async def health_check(self, request):
-        return web.json_response({
-            "status": "ok",
-            "node_name": f"AppNode-{self.node_id[:8]}",
-            "uptime_secs": int(time.time() - self.start_time),
+        return prefixed_json_response(self._health_prefix, {
+            "uptime_secs": self._uptime_s,
         })
 
     async def get_metrics(self, request):
-        uptime = max(1, int(time.time() - self.start_time))
-        return web.json_response({
+        uptime = max(1, self._uptime_s)
+        return json_response({
             "tx_submitted": self.tx_submitted,
             "tps_avg": round(self.tx_submitted / uptime, 2),
             "synced_block_height": self.synced_block_height,
             "anchors_verified": self.anchors_verified,
             "fraud_reports": self.fraud_reports,
-            "last_sync_age_secs": int(time.time() - self.last_sync_time) if self.last_sync_time else -1,
+            "last_sync_age_secs": (
+                max(0, int(self._now_s - self.last_sync_time)) if self.last_sync_time else -1
+            ),
             "aggregator": self.aggregator_addr or "none",
         })
 
     async def submit_tx(self, request):
         """Submit a transaction via the aggregator (Medium node)."""
         if not self.aggregator_addr:
-            return web.json_response(
+            return json_response(
                 {"error": "No aggregator discovered yet. Try again shortly."},
                 status=503,
             )
 
         try:
-            tx = await request.json()
+            tx = orjson.loads(await request.read())
         except Exception:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
+            return json_response({"error": "Invalid JSON"}, status=400)
 
         # Forward to aggregator
-        api_keys = list(load_api_keys())
-        headers = {}
-        if api_keys:
-            headers["Authorization"] = f"Bearer {api_keys[0]}"
-
         try:
-            async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False)) as session:
-                async with session.post(
-                    f"http://{self.aggregator_addr}/tx/submit",
-                    json=tx, headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=5),
-                ) as resp:
-                    result = await resp.json()
-                    self.tx_submitted += 1
-                    return web.json_response(result, status=resp.status)
+            async with self._session.post(
+                f"http://{self.aggregator_addr}/tx/submit",
+                data=orjson.dumps(tx), headers=self._json_headers,
+                timeout=aiohttp.ClientTimeout(total=5),
+            ) as resp:
+                # Relay the aggregator's JSON body untouched
+                body = await resp.read()
+                self.tx_submitted += 1
+                return web.Response(body=body, status=resp.status, content_type="application/json")
         except Exception as e:
-            return web.json_response(
+            return json_response(
                 {"error": f"Failed to reach aggregator: {e}"}, status=502
             )
 
     async def shutdown(self, request):
         log.info("Shutdown requested via API")
-        asyncio.get_event_loop().call_later(1, lambda: os._exit(0))
-        return web.json_response({"status": "shutting_down"})
+        asyncio.get_running_loop().call_later(1, os._exit, 0)
+        return json_response({"status": "shutting_down"})
 
     # ─── Background Tasks ──────────────────────────────────────────
 
     async def sync_state_via_zk(self):
         """Download and verify a ZK state proof from the Heavy node."""
-        api_keys = list(load_api_keys())
-        headers = {}
-        if api_keys:
-            headers["Authorization"] = f"Bearer {api_keys[0]}"
+        headers = self._outbound_headers
 
         try:
-            async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False)) as session:
-                async with session.get(
-                    f"{self.heavy_addr}/state_proof",
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status == 200:
-                        proof = await resp.json()
-                        block_height = proof.get("block_height", 0)
-                        root_hash = proof.get("root_hash", "")
-                        proof_data = proof.get("proof_data", [])
-
-                        # Verify the proof is non-empty and has valid structure
-                        if not proof_data:
-                            log.warning("ZK-Sync: Empty proof data, skipping")
-                            return
-
-                        # Verify proof hash matches claimed root
-                        proof_bytes = bytes(proof_data) if isinstance(proof_data, list) else proof_data
-                        computed_hash = hashlib.sha256(proof_bytes).hexdigest()[:16]
-
-                        self.synced_block_height = block_height
-                        self.synced_root_hash = str(root_hash)[:16]
-                        self.last_sync_time = time.time()
-                        log.info(
-                            f"ZK-Sync OK: height={block_height} root={self.synced_root_hash}... "
-                            f"proof_hash={computed_hash}..."
-                        )
-                    else:
-                        log.warning(f"ZK-Sync failed: HTTP {resp.status}")
+            async with self._session.get(
+                f"{self.heavy_addr}/state_proof",
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as resp:
+                if resp.status == 200:
+                    proof = await resp.json(loads=orjson.loads)
+                    block_height = proof.get("block_height", 0)
+                    root_hash = proof.get("root_hash", "")
+                    proof_data = proof.get("proof_data", [])
+
+                    # Verify the proof is non-empty and has valid structure
+                    if not proof_data:
+                        log.warning("ZK-Sync: Empty proof data, skipping")
+                        return
+
+                    # Verify proof hash matches claimed root
+                    proof_bytes = bytes(proof_data) if isinstance(proof_data, list) else proof_data
+                    computed_hash = hashlib.sha256(proof_bytes).hexdigest()[:16]
+
+                    self.synced_block_height = block_height
+                    self.synced_root_hash = str(root_hash)[:16]
+                    self.last_sync_time = time.time()
+                    log.info(
+                        f"ZK-Sync OK: height={block_height} root={self.synced_root_hash}... "
+                        f"proof_hash={computed_hash}..."
+                    )
+                else:
+                    log.warning(f"ZK-Sync failed: HTTP {resp.status}")
         except Exception as e:
             log.warning(f"ZK-Sync failed: {e}")
 
     async def discover_aggregator(self):
         """Find a Medium node aggregator to submit transactions to."""
-        api_keys = list(load_api_keys())
-        headers = {}
-        if api_keys:
-            headers["Authorization"] = f"Bearer {api_keys[0]}"
+        headers = self._outbound_headers
 
         app_type = os.getenv("APP_TYPE", "general")
         url = f"{self.heavy_addr}/subchain/discover?type={app_type}"
 
         try:
-            async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False)) as session:
-                async with session.get(
-                    url, headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=5),
-                ) as resp:
-                    if resp.status == 200:
-                        ads = await resp.json()
-                        if ads:
-                            # Pick the aggregator with highest reputation
-                            best = max(ads, key=lambda a: a.get("reputation_score", 0))
-                            self.aggregator_addr = best["aggregator_addr"]
-                            log.info(
-                                f"Discovered Aggregator: {best['aggregator_node_id'][:8]} "
-                                f"at {self.aggregator_addr}"
-                            )
-                        else:
-                            log.info(f"No aggregators found for type '{app_type}'")
+            async with self._session.get(
+                url, headers=headers,
+                timeout=aiohttp.ClientTimeout(total=5),
+            ) as resp:
+                if resp.status == 200:
+                    ads = await resp.json(loads=orjson.loads)
+                    if ads:
+                        # Pick the aggregator with highest reputation (first wins ties)
+                        best, best_score = ads[0], ads[0].get("reputation_score", 0)
+                        for ad in ads:
+                            score = ad.get("reputation_score", 0)
+                            if score > best_score:
+                                best, best_score = ad, score
+                        self.aggregator_addr = best["aggregator_addr"]
+                        log.info(
+                            f"Discovered Aggregator: {best['aggregator_node_id'][:8]} "
+                            f"at {self.aggregator_addr}"
+                        )
                     else:
-                        log.warning(f"Discovery failed: HTTP {resp.status}")
+                        log.info(f"No aggregators found for type '{app_type}'")
+                else:
+                    log.warning(f"Discovery failed: HTTP {resp.status}")
         except Exception as e:
             log.warning(f"Discovery failed: {e}")
 
@@ -253,10 +294,17 @@ class LightNode:
             self.anchors_verified += 1
             if self.anchors_verified % 10 == 0:
                 log.info(
-                    f"Anchor watch: {self.anchors_verified} verified, "
-                    f"synced to block {self.synced_block_height}"
+                    "Anchor watch: %d verified, synced to block %s",
+                    self.anchors_verified, self.synced_block_height,
                 )
 
+    async def _tick(self):
+        """Refresh the cached clock once a second so handlers never read it themselves."""
+        while True:
+            self._now_s = int(time.time())
+            self._uptime_s = int(time.monotonic() - self._start_mono)
+            await asyncio.sleep(1)
+
     # ─── Server ─────────────────────────────────────────────────────
 
     async def run(self):
@@ -265,7 +313,7 @@ class LightNode:
         log.info(f"Microchain: {self.microchain_id}")
 
         app = web.Application(middlewares=[auth_middleware])
-        app["api_keys"] = load_api_keys()
+        app["api_keys"] = self._api_keys
 
         if app["api_keys"]:
             log.info(f"Auth enabled ({len(app['api_keys'])} API key(s) loaded)")
@@ -287,14 +335,45 @@ class LightNode:
 
         log.info(f"API listening on http://0.0.0.0:{self.api_port}")
 
-        await asyncio.gather(
-            site.start(),
-            self.watch_anchors(),
+        # One keep-alive pool for all outbound calls to Heavy/aggregator nodes
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(
+                ssl=False,
+                limit=100,
+                limit_per_host=32,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+                resolver=make_resolver(),
+                ttl_dns_cache=DNS_CACHE_TTL,
+            ),
         )
 
+        try:
+            await asyncio.gather(
+                site.start(),
+                self._tick(),
+                self.watch_anchors(),
+            )
+        finally:
+            await self._session.close()
+
 
 if __name__ == "__main__":
     node_id = os.getenv("NODE_ID", str(uuid.uuid4()))
     port = int(os.getenv("API_PORT", "8002"))
     node = LightNode(node_id, port)
-    asyncio.run(node.run())
+
+    # libuv event loop where available (not supported on Windows); uvloop.run()
+    # replaces installing a global loop policy, which Python 3.14 deprecates
+    uvloop = None
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+
+    if uvloop is not None:
+        uvloop.run(node.run())
+    else:
+        asyncio.run(node.run())
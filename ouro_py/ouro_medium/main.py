@@ -16,9 +16,18 @@ import os
 import uuid
 import time
 import logging
-import json
 import binascii
+import functools
+import ipaddress
+import itertools
+import json
+from datetime import datetime, timezone
+import ssl
+from collections import deque
+from typing import Annotated
 import aiohttp
+import msgspec
+import orjson
 from aiohttp import web
 
 # Fix Windows asyncio: ProactorEventLoop raises ConnectionResetError [WinError 10054]
@@ -29,6 +38,53 @@ if sys.platform == "win32":
 logging.basicConfig(level=logging.INFO, format="[MediumNode] %(message)s")
 log = logging.getLogger("medium")
 
+# Plain-text "what is my IP" services, queried concurrently at startup
+PUBLIC_IP_PROBES = (
+    "https://api.ipify.org",
+    "https://api4.my-ip.io/v2/ip.txt",
+)
+
+# Mempool txs per batch anchor, and how many anchors may be in flight at once
+BATCH_SIZE = 100
+MAX_INFLIGHT_ANCHORS = 4
+
+# Heavy/aggregator hosts rarely change address; cache lookups across poll cycles
+DNS_CACHE_TTL = 300
+
+
+class TxIn(msgspec.Struct):
+    """Required shape of a submitted tx; other fields pass through untouched."""
+    sender: Annotated[str, msgspec.Meta(min_length=1)]
+    recipient: Annotated[str, msgspec.Meta(min_length=1)]
+    amount: Annotated[float, msgspec.Meta(ge=0)]
+
+
+# Txs are kept as dicts (every field is hashed into the batch leaf)
+_tx_decoder = msgspec.json.Decoder(dict)
+
+
+def make_resolver():
+    """Use the c-ares resolver when aiodns is installed, else the threaded default."""
+    try:
+        return aiohttp.AsyncResolver()
+    except RuntimeError:
+        return aiohttp.ThreadedResolver()
+
+
+def json_response(data, status: int = 200) -> web.Response:
+    """web.json_response equivalent that encodes with orjson."""
+    return web.Response(body=orjson.dumps(data), status=status, content_type="application/json")
+
+
+def json_prefix(static: dict) -> bytes:
+    """Encode fields that never change as an open JSON object, ready to extend."""
+    return orjson.dumps(static)[:-1] + b","
+
+
+def prefixed_json_response(prefix: bytes, dynamic: dict) -> web.Response:
+    """Complete a json_prefix() body with the per-request fields."""
+    return web.Response(body=prefix + orjson.dumps(dynamic)[1:], content_type="application/json")
+
 
 # â”€â”€â”€ Auth Middleware â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
@@ -55,7 +111,7 @@ async def auth_middleware(request, handler):
 
     auth_header = request.headers.get("Authorization", "")
     if not auth_header.startswith("Bearer "):
-        return web.json_response(
+        return json_response(
             {"error": "Missing or invalid Authorization header. Use: Bearer <api_key>"},
             status=401,
         )
@@ -67,7 +123,7 @@ async def auth_middleware(request, handler):
     authorized = any(secrets.compare_digest(token, key) for key in api_keys)
 
     if not authorized:
-        return web.json_response({"error": "Invalid API key"}, status=403)
+        return json_response({"error": "Invalid API key"}, status=403)
 
     return await handler(request)
 
@@ -79,35 +135,76 @@ class MediumNode:
         self.node_id = node_id
         self.api_port = api_port
         self.role = "medium"
-        self.start_time = time.time()
+        self._start_mono = time.monotonic()
+
+        # Clock cache shared by request handlers, refreshed by _tick()
+        self._now_s = int(time.time())
+        self._uptime_s = 0
+
         self.heavy_addr = os.getenv("HEAVY_ADDR", "http://localhost:8000")
         self.heavy_online = False
-        self.mempool = []
+        self.mempool: deque = deque()
         self.batches_submitted = 0
 
-    async def get_identity(self, request):
-        uptime = int(time.time() - self.start_time)
-        return web.json_response({
+        # Queued tx ids: node prefix + counter seeded from boot time, unique across restarts
+        self._id_prefix = self.node_id[:8]
+        self._next_tx_seq = itertools.count(time.time_ns())
+
+        # Parsed once; outbound calls authenticate with the first key
+        self._api_keys = load_api_keys()
+        self._outbound_headers = (
+            {"Authorization": f"Bearer {next(iter(self._api_keys))}"} if self._api_keys else {}
+        )
+        self._json_headers = {**self._outbound_headers, "Content-Type": "application/json"}
+
+        # Shared outbound HTTP session (created in run())
+        self._session: aiohttp.ClientSession | None = None
+
+        # Subchain Market payload; built once the public address is known
+        self._advertise_template: dict | None = None
+
+        # Batch anchoring: _flush_worker() drains the mempool whenever this is set
+        self._flush_event = asyncio.Event()
+        self._anchor_slots = asyncio.Semaphore(MAX_INFLIGHT_ANCHORS)
+        self._inflight_anchors: set[asyncio.Task] = set()
+
+        # Periodic background tasks and their intervals (seconds), run by _scheduler()
+        self._schedule = {
+            self.monitor_heavy_nodes: 5,
+            self.advertise_to_heavy: 5,
+            self.request_flush: 10,
+            self.submit_heartbeat: 5,
+        }
+
+        # Constant fields of /identity and /health, encoded once
+        self._identity_prefix = json_prefix({
             "node_id": self.node_id,
             "role": self.role,
             "public_name": f"Aggregator-{self.node_id[:8]}",
-            "total_uptime_secs": uptime,
             "difficulty": "medium",
             "version": "0.3.0-py",
+        })
+        self._health_prefix = json_prefix({
+            "status": "ok",
+            "node_name": f"Aggregator-{self.node_id[:8]}",
+        })
+
+    async def get_identity(self, request):
+        uptime = self._uptime_s
+        return prefixed_json_response(self._identity_prefix, {
+            "total_uptime_secs": uptime,
             "mempool_size": len(self.mempool),
             "batches_submitted": self.batches_submitted,
         })
 
     async def health_check(self, request):
-        return web.json_response({
-            "status": "ok",
-            "node_name": f"Aggregator-{self.node_id[:8]}",
-            "uptime_secs": int(time.time() - self.start_time),
+        return prefixed_json_response(self._health_prefix, {
+            "uptime_secs": self._uptime_s,
             "heavy_node_status": "online" if self.heavy_online else "offline",
         })
 
     async def get_metrics(self, request):
-        return web.json_response({
+        return json_response({
             "mempool_size": len(self.mempool),
             "batches_submitted": self.batches_submitted,
             "heavy_online": self.heavy_online,
@@ -116,242 +213,331 @@ class MediumNode:
     async def get_balance(self, request):
         address = request.match_info["address"]
         url = f"{self.heavy_addr}/account/balance/{address}"
-        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False)) as session:
-            async with session.get(url) as resp:
-                return web.json_response(await resp.json(), status=resp.status)
+        async with self._session.get(url) as resp:
+            return web.Response(body=await resp.read(), status=resp.status, content_type="application/json")
 
     async def submit_tx(self, request):
         """Receive transaction from Light node and queue in local mempool."""
         try:
-            tx = await request.json()
-        except Exception:
-            return web.json_response({"error": "Invalid JSON"}, status=400)
-
-        # Basic structural check
-        if not tx.get("sender") or not tx.get("recipient"):
-            return web.json_response({"error": "Missing sender or recipient"}, status=400)
+            tx = _tx_decoder.decode(await request.read())
+            msgspec.convert(tx, TxIn)
+        except msgspec.ValidationError as e:
+            return json_response({"error": str(e)}, status=400)
+        except msgspec.DecodeError:
+            return json_response({"error": "Invalid JSON"}, status=400)
 
         self.mempool.append(tx)
-        log.info(f"TX received: {tx['sender']}â†’{tx['recipient']} amt={tx.get('amount', 0)}")
-        return web.json_response({"status": "queued", "tx_id": str(uuid.uuid4())})
+        if len(self.mempool) >= BATCH_SIZE:
+            self._flush_event.set()
+        log.info("TX received: %sâ†’%s amt=%s", tx["sender"], tx["recipient"], tx["amount"])
+        return json_response({
+            "status": "queued",
+            "tx_id": f"{self._id_prefix}-{next(self._next_tx_seq):016x}",
+        })
 
     # â”€â”€â”€ Background Tasks â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
 
     async def monitor_heavy_nodes(self):
-        """Periodically checks if the Heavy node settlement layer is reachable."""
-        while True:
-            try:
-                async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False)) as session:
-                    async with session.get(f"{self.heavy_addr}/health", timeout=5) as resp:
-                        if resp.status == 200:
-                            if not self.heavy_online:
-                                log.info(f"Settlement layer {self.heavy_addr} is ONLINE")
-                            self.heavy_online = True
-                        else:
-                            self.heavy_online = False
-            except Exception:
-                if self.heavy_online:
-                    log.warning(f"Settlement layer {self.heavy_addr} is OFFLINE")
-                self.heavy_online = False
-            await asyncio.sleep(5)
-
-    async def _detect_public_addr(self):
+        """Check whether the Heavy node settlement layer is reachable."""
+        try:
+            async with self._session.get(f"{self.heavy_addr}/health", timeout=5) as resp:
+                if resp.status == 200:
+                    if not self.heavy_online:
+                        log.info(f"Settlement layer {self.heavy_addr} is ONLINE")
+                    self.heavy_online = True
+                else:
+                    self.heavy_online = False
+        except Exception:
+            if self.heavy_online:
+                log.warning(f"Settlement layer {self.heavy_addr} is OFFLINE")
+            self.heavy_online = False
+
+    async def _fetch_ip(self, session: aiohttp.ClientSession, url: str, ssl_ctx: ssl.SSLContext):
+        async with session.get(url, timeout=5, ssl=ssl_ctx) as resp:
+            resp.raise_for_status()
+            addr = (await resp.text()).strip()
+        ipaddress.ip_address(addr)  # reject error pages served with 200
+        return addr
+
+    async def _detect_public_addr(self, session: aiohttp.ClientSession):
         """Helper to find public IP for P2P advertising."""
         env_addr = os.getenv("PUBLIC_ADDR")
         if env_addr:
             return env_addr
 
+        # The shared connector skips verification for Heavy nodes; probes are public TLS
+        ssl_ctx = ssl.create_default_context()
+        pending = {
+            asyncio.create_task(self._fetch_ip(session, url, ssl_ctx))
+            for url in PUBLIC_IP_PROBES
+        }
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get("https://api.ipify.org", timeout=5) as resp:
-                    return await resp.text()
-        except Exception:
-            return "127.0.0.1"
+            # First probe to succeed wins; a fast failure just waits for the other
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+        return "127.0.0.1"
+
+    def _build_advertise_template(self, public_ip: str):
+        """Fill in the advertise fields that stay fixed for the node's lifetime."""
+        self._advertise_template = {
+            "subchain_id": "default_subchain",
+            "aggregator_node_id": self.node_id,
+            "aggregator_addr": f"{public_ip}:{self.api_port}",
+            "app_type": os.getenv("APP_TYPE", "general"),
+            "capacity_percent": 100,
+            "last_seen": "",
+            "reputation_score": 1.0,
+        }
 
     async def advertise_to_heavy(self):
-        """Periodically registers this aggregator in the Subchain Market."""
-        public_ip = await self._detect_public_addr()
-        log.info(f"Advertising with address: {public_ip}:{self.api_port}")
-
+        """Register this aggregator in the Subchain Market."""
+        if self._advertise_template is None:
+            public_ip = await self._detect_public_addr(self._session)
+            log.info(f"Advertising with address: {public_ip}:{self.api_port}")
+            self._build_advertise_template(public_ip)
+
+        if not self.heavy_online:
+            return
+
+        url = f"{self.heavy_addr}/subchain/advertise"
+        payload = self._advertise_template
+        payload["capacity_percent"] = max(0, 100 - len(self.mempool))
+        payload["last_seen"] = (
+            datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+        )
+        try:
+            async with self._session.post(
+                url, data=orjson.dumps(payload), headers=self._json_headers,
+                timeout=aiohttp.ClientTimeout(total=5),
+            ) as resp:
+                if resp.status == 200:
+                    log.info("Advertised to Subchain Market")
+                else:
+                    log.warning(f"Advertise failed: HTTP {resp.status}")
+        except Exception as e:
+            log.warning(f"Advertise failed: {e}")
+
+    async def request_flush(self):
+        """Wake the flush worker so partial batches are anchored too."""
+        self._flush_event.set()
+
+    async def _flush_worker(self):
+        """Drain the mempool into batch anchors, keeping several anchors in flight."""
         while True:
-            await asyncio.sleep(5)
-            if not self.heavy_online:
-                continue
-
-            url = f"{self.heavy_addr}/subchain/advertise"
-            api_keys = list(load_api_keys())
-            headers = {"Authorization": f"Bearer {api_keys[0]}"} if api_keys else {}
+            await self._flush_event.wait()
+            self._flush_event.clear()
+
+            # Pop at most what is queued now so the loop ends even while anchors keep
+            # failing; failed batches go back to the front and count against this budget
+            budget = len(self.mempool)
+            while budget > 0 and self.mempool and self.heavy_online:
+                await self._anchor_slots.acquire()
+                popleft = self.mempool.popleft
+                batch = [popleft() for _ in range(min(BATCH_SIZE, budget, len(self.mempool)))]
+                budget -= len(batch)
+                if not batch:
+                    self._anchor_slots.release()
+                    break
+
+                task = asyncio.create_task(self.batch_flush(batch))
+                self._inflight_anchors.add(task)
+                task.add_done_callback(self._anchor_done)
+
+    def _anchor_done(self, task: asyncio.Task):
+        self._inflight_anchors.discard(task)
+        self._anchor_slots.release()
+        if not task.cancelled() and task.exception():
+            log.warning(f"Batch anchor task failed: {task.exception()}")
+
+    async def batch_flush(self, batch: list):
+        """Submit one batch of mempool txs to the Heavy node as a batch anchor."""
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+        import binascii
 
-            payload = {
-                "subchain_id": "default_subchain",
-                "aggregator_node_id": self.node_id,
-                "aggregator_addr": f"{public_ip}:{self.api_port}",
-                "app_type": os.getenv("APP_TYPE", "general"),
-                "capacity_percent": max(0, 100 - len(self.mempool)),
-                "last_seen": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                "reputation_score": 1.0,
-            }
+        # Load microchain signing key (for test purposes, the aggregator signs the leaf)
+        key_hex = os.getenv("MICROCHAIN_KEYPAIR_HEX")
+        signing_key = None
+        if key_hex:
             try:
-                async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False)) as session:
-                    async with session.post(
-                        url, json=payload, headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=5),
-                    ) as resp:
-                        if resp.status == 200:
-                            log.info("Advertised to Subchain Market")
-                        else:
-                            log.warning(f"Advertise failed: HTTP {resp.status}")
+                signing_key = ed25519.Ed25519PrivateKey.from_private_bytes(binascii.unhexlify(key_hex))
             except Exception as e:
-                log.warning(f"Advertise failed: {e}")
+                log.error(f"Failed to load microchain key: {e}")
 
-    async def batch_flush(self):
-        """Periodically flush mempool to Heavy node as a batch anchor."""
-        from cryptography.hazmat.primitives.asymmetric import ed25519
-        import binascii
+        # Wrap transactions into MicroAnchorLeaf structures
+        height = 0
+        chain_id = "ouroboros-mainnet-1"
+        chain_id_bytes = chain_id.encode()
+        height_bytes = height.to_bytes(8, 'big')
 
-        while True:
-            await asyncio.sleep(10)
-            if not self.mempool or not self.heavy_online:
-                continue
-
-            batch = self.mempool[:100]
-            self.mempool = self.mempool[100:]
-
-            # Load microchain signing key (for test purposes, the aggregator signs the leaf)
-            key_hex = os.getenv("MICROCHAIN_KEYPAIR_HEX")
-            signing_key = None
-            if key_hex:
-                try:
-                    signing_key = ed25519.Ed25519PrivateKey.from_private_bytes(binascii.unhexlify(key_hex))
-                except Exception as e:
-                    log.error(f"Failed to load microchain key: {e}")
-
-            # Wrap transactions into MicroAnchorLeaf structures
-            leaves = []
-            for tx in batch:
-                timestamp = int(time.time())
-                microchain_id_str = tx.get("microchain_id", "00000000-0000-0000-0000-000000000000")
-                try:
-                    # Convert to UUID and get raw 16 bytes
-                    microchain_uuid_bytes = uuid.UUID(microchain_id_str).bytes
-                except Exception:
-                    microchain_uuid_bytes = b"\x00" * 16
-
-                height = 0
-                chain_id = "ouroboros-mainnet-1"
-                micro_root = hashlib.sha256(json.dumps(tx).encode()).digest()
-                
-                # Construct payload: chain_id | microchain_id (16 bytes) | height BE (8) | micro_root | timestamp BE (8)
-                payload_bytes = (
-                    chain_id.encode() +
-                    microchain_uuid_bytes +
-                    height.to_bytes(8, 'big') +
-                    micro_root +
-                    timestamp.to_bytes(8, 'big')
-                )
-                
-                sig_hex = "00" * 64
-                if signing_key:
-                    sig_hex = binascii.hexlify(signing_key.sign(payload_bytes)).decode()
-
-                leaf = {
-                    "microchain_id": microchain_id_str,
-                    "height": height,
-                    "micro_root_hex": binascii.hexlify(micro_root).decode(),
-                    "timestamp": timestamp,
-                    "sig_micro_hex": sig_hex,
-                    "archive_url": None,
-                    "tx_data": json.dumps(tx),
-                    "chain_id": chain_id
-                }
-                leaves.append(leaf)
-
-            serialized_leaves = json.dumps(leaves)
-            batch_root = hashlib.sha256(serialized_leaves.encode()).hexdigest()
+        timestamp = self._now_s
+
+        leaves = []
+        for tx in batch:
+            microchain_id_str = tx.get("microchain_id", "00000000-0000-0000-0000-000000000000")
+            try:
+                # Convert to UUID and get raw 16 bytes
+                microchain_uuid_bytes = uuid.UUID(microchain_id_str).bytes
+            except Exception:
+                microchain_uuid_bytes = b"\x00" * 16
+
+            # stdlib json on purpose: these hashed bytes keep its default separators and
+            # ASCII escaping, which orjson would change
+            tx_data = json.dumps(tx)
+            micro_root = hashlib.sha256(tx_data.encode()).digest()
+            
+            # Construct payload: chain_id | microchain_id (16 bytes) | height BE (8) | micro_root | timestamp BE (8)
+            payload_bytes = b"".join((
+                chain_id_bytes,
+                microchain_uuid_bytes,
+                height_bytes,
+                micro_root,
+                timestamp.to_bytes(8, 'big'),
+            ))
+            
+            sig_hex = "00" * 64
+            if signing_key:
+                sig_hex = binascii.hexlify(signing_key.sign(payload_bytes)).decode()
+
+            leaf = {
+                "microchain_id": microchain_id_str,
+                "height": height,
+                "micro_root_hex": binascii.hexlify(micro_root).decode(),
+                "timestamp": timestamp,
+                "sig_micro_hex": sig_hex,
+                "archive_url": None,
+                "tx_data": tx_data,
+                "chain_id": chain_id
+            }
+            leaves.append(leaf)
+
+        serialized_leaves = json.dumps(leaves)
+        batch_root = hashlib.sha256(serialized_leaves.encode()).digest()
+
+        payload = {
+            # serde expects Vec<u8> as a JSON int array
+            "batch_root": list(batch_root),
+            "aggregator": self.node_id,
+            "leaf_count": len(leaves),
+            "serialized_leaves": serialized_leaves,
+        }
+
+        url = f"{self.heavy_addr}/subchain/batch_anchor"
+
+        try:
+            async with self._session.post(
+                url, data=orjson.dumps(payload), headers=self._json_headers,
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as resp:
+                if resp.status == 200:
+                    log.info(
+                        f"Batch anchored successfully: root={batch_root[:8].hex()}... "
+                        f"({len(batch)} txs)"
+                    )
+                    self.batches_submitted += 1
+                else:
+                    log.warning(f"Batch anchor HTTP {resp.status} â€” re-queuing {len(batch)} txs")
+                    self.mempool.extendleft(reversed(batch))
+        except Exception as e:
+            log.warning(f"Batch anchor error: {e} â€” re-queuing {len(batch)} txs")
+            self.mempool.extendleft(reversed(batch))
+
+    async def submit_heartbeat(self):
+        """Submit a heartbeat to the Heavy node to claim rewards."""
+        if not self.heavy_online:
+            return
+
+        try:
+            # Use a dummy signing key if not set
+            from cryptography.hazmat.primitives.asymmetric import ed25519
+            import binascii
+
+            key_hex = os.getenv("NODE_KEYPAIR_HEX", "0" * 64)
+            key_bytes = binascii.unhexlify(key_hex)
+            signing_key = ed25519.Ed25519PrivateKey.from_private_bytes(key_bytes)
+            pubkey_hex = binascii.hexlify(signing_key.public_key().public_bytes_raw()).decode()
+
+            wallet_address = os.getenv("NODE_WALLET_ADDRESS", f"wallet-{self.node_id[:8]}")
+            timestamp = int(time.time())
+            nonce = "0"
+            message = f"heartbeat:{self.node_id}:{wallet_address}:{timestamp}:{nonce}"
+            signature = signing_key.sign(message.encode())
+            sig_hex = binascii.hexlify(signature).decode()
 
             payload = {
-                "batch_root": list(binascii.unhexlify(batch_root)),
-                "aggregator": self.node_id,
-                "leaf_count": len(leaves),
-                "serialized_leaves": serialized_leaves,
+                "node_id": self.node_id,
+                "wallet_address": wallet_address,
+                "role": self.role,
+                "public_key": pubkey_hex,
+                "signature": sig_hex,
+                "timestamp": timestamp,
+                "nonce": nonce,
             }
 
-            url = f"{self.heavy_addr}/subchain/batch_anchor"
-            api_keys = list(load_api_keys())
-            headers = {"Authorization": f"Bearer {api_keys[0]}"} if api_keys else {}
+            url = f"{self.heavy_addr}/rewards/heartbeat"
 
-            try:
-                async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False)) as session:
-                    async with session.post(
-                        url, json=payload, headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=10),
-                    ) as resp:
-                        if resp.status == 200:
-                            log.info(
-                                f"Batch anchored successfully: root={batch_root[:16]}... "
-                                f"({len(batch)} txs)"
-                            )
-                            self.batches_submitted += 1
-                        else:
-                            log.warning(f"Batch anchor HTTP {resp.status} â€” re-queuing {len(batch)} txs")
-                            self.mempool = batch + self.mempool
-            except Exception as e:
-                log.warning(f"Batch anchor error: {e} â€” re-queuing {len(batch)} txs")
-                self.mempool = batch + self.mempool
+            async with self._session.post(
+                url, data=orjson.dumps(payload), headers=self._json_headers, timeout=5
+            ) as resp:
+                if resp.status == 200:
+                    log.info(f"Heartbeat submitted successfully (ts: {timestamp})")
+                else:
+                    log.warning(f"Heartbeat submission failed: HTTP {resp.status}")
+        except Exception as e:
+            log.warning(f"Heartbeat submission error: {e}")
 
-    async def submit_heartbeat_loop(self):
-        """Periodically submit heartbeats to the Heavy node to claim rewards."""
+    async def _tick(self):
+        """Refresh the cached clock once a second so handlers never read it themselves."""
         while True:
-            await asyncio.sleep(5)
-            if not self.heavy_online:
-                continue
+            self._now_s = int(time.time())
+            self._uptime_s = int(time.monotonic() - self._start_mono)
+            await asyncio.sleep(1)
+
+    async def _scheduler(self):
+        """Drive all periodic tasks from one timer, starting whatever is due per wake-up.
+
+        Each run is its own asyncio task, so one slow call (e.g. a Heavy request
+        waiting out its timeout) never holds up the others. A task still running
+        when it comes due again skips that round.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        due_at = {task: now + interval for task, interval in self._schedule.items()}
+        if self.monitor_heavy_nodes in due_at:
+            due_at[self.monitor_heavy_nodes] = now  # learn Heavy status before anything else
+        running: dict = {}
+
+        def done(task, run: asyncio.Task):
+            del running[task]
+            if not run.cancelled() and run.exception():
+                log.warning(f"{task.__name__} failed: {run.exception()}")
 
-            try:
-                # Use a dummy signing key if not set
-                from cryptography.hazmat.primitives.asymmetric import ed25519
-                import binascii
-
-                key_hex = os.getenv("NODE_KEYPAIR_HEX", "0" * 64)
-                key_bytes = binascii.unhexlify(key_hex)
-                signing_key = ed25519.Ed25519PrivateKey.from_private_bytes(key_bytes)
-                pubkey_hex = binascii.hexlify(signing_key.public_key().public_bytes_raw()).decode()
-
-                wallet_address = os.getenv("NODE_WALLET_ADDRESS", f"wallet-{self.node_id[:8]}")
-                timestamp = int(time.time())
-                nonce = "0"
-                message = f"heartbeat:{self.node_id}:{wallet_address}:{timestamp}:{nonce}"
-                signature = signing_key.sign(message.encode())
-                sig_hex = binascii.hexlify(signature).decode()
-
-                payload = {
-                    "node_id": self.node_id,
-                    "wallet_address": wallet_address,
-                    "role": self.role,
-                    "public_key": pubkey_hex,
-                    "signature": sig_hex,
-                    "timestamp": timestamp,
-                    "nonce": nonce,
-                }
-
-                url = f"{self.heavy_addr}/rewards/heartbeat"
-                api_keys = list(load_api_keys())
-                headers = {"Authorization": f"Bearer {api_keys[0]}"} if api_keys else {}
-
-                async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False)) as session:
-                    async with session.post(url, json=payload, headers=headers, timeout=5) as resp:
-                        if resp.status == 200:
-                            log.info(f"Heartbeat submitted successfully (ts: {timestamp})")
-                        else:
-                            log.warning(f"Heartbeat submission failed: HTTP {resp.status}")
-            except Exception as e:
-                log.warning(f"Heartbeat submission error: {e}")
+        try:
+            while True:
+                await asyncio.sleep(max(0.0, min(due_at.values()) - loop.time()))
+                now = loop.time()
+                for task, at in due_at.items():
+                    if at > now:
+                        continue
+                    due_at[task] = now + self._schedule[task]
+                    if task not in running:
+                        running[task] = asyncio.create_task(task())
+                        running[task].add_done_callback(functools.partial(done, task))
+        finally:
+            for run in running.values():
+                run.cancel()
 
     async def run(self):
         log.info(f"--- Ouroboros Medium Node (Python) ---")
         log.info(f"ID: {self.node_id} | Port: {self.api_port}")
 
         app = web.Application(middlewares=[auth_middleware])
-        app["api_keys"] = load_api_keys()
+        app["api_keys"] = self._api_keys
 
         if app["api_keys"]:
             log.info(f"Auth enabled ({len(app['api_keys'])} API key(s) loaded)")
@@ -374,17 +560,46 @@ class MediumNode:
 
         log.info(f"API listening on http://0.0.0.0:{self.api_port}")
 
-        await asyncio.gather(
-            site.start(),
-            self.monitor_heavy_nodes(),
-            self.advertise_to_heavy(),
-            self.batch_flush(),
-            self.submit_heartbeat_loop(),
+        # One keep-alive pool for all outbound calls to the Heavy node
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(
+                ssl=False,
+                limit=100,
+                limit_per_host=32,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+                resolver=make_resolver(),
+                ttl_dns_cache=DNS_CACHE_TTL,
+            ),
         )
 
+        try:
+            await asyncio.gather(
+                site.start(),
+                self._tick(),
+                self._scheduler(),
+                self._flush_worker(),
+            )
+        finally:
+            await self._session.close()
+
 
 if __name__ == "__main__":
     node_id = os.getenv("NODE_ID", str(uuid.uuid4()))
     port = int(os.getenv("API_PORT", "8001"))
     node = MediumNode(node_id, port)
-    asyncio.run(node.run())
+
+    # libuv event loop where available (not supported on Windows); uvloop.run()
+    # replaces installing a global loop policy, which Python 3.14 deprecates
+    uvloop = None
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+
+    if uvloop is not None:
+        uvloop.run(node.run())
+    else:
+        asyncio.run(node.run())
@@ -0,0 +1,225 @@
+"""Tests for the Medium node's background loops (ouro_medium/main.py)"""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location(
+    "ouro_medium_main", Path(__file__).resolve().parents[1] / "ouro_medium" / "main.py"
+)
+medium = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(medium)
+
+
+def make_node() -> "medium.MediumNode":
+    return medium.MediumNode("00000000-test-node", api_port=0)
+
+
+def test_scheduler_slow_task_does_not_stall_others():
+    async def scenario():
+        node = make_node()
+        fast_runs = 0
+        slow_starts = 0
+
+        async def fast():
+            nonlocal fast_runs
+            fast_runs += 1
+
+        async def slow():
+            nonlocal slow_starts
+            slow_starts += 1
+            await asyncio.sleep(10)
+
+        node._schedule = {fast: 0.01, slow: 0.01}
+        scheduler = asyncio.create_task(node._scheduler())
+        await asyncio.sleep(0.2)
+        scheduler.cancel()
+        await asyncio.gather(scheduler, return_exceptions=True)
+        return fast_runs, slow_starts
+
+    fast_runs, slow_starts = asyncio.run(scenario())
+    assert fast_runs >= 5
+    # Still running when it came due again, so never started twice
+    assert slow_starts == 1
+
+
+def test_scheduler_keeps_running_after_task_failure():
+    async def scenario():
+        node = make_node()
+        runs = 0
+
+        async def flaky():
+            nonlocal runs
+            runs += 1
+            raise RuntimeError("heavy unreachable")
+
+        node._schedule = {flaky: 0.01}
+        scheduler = asyncio.create_task(node._scheduler())
+        await asyncio.sleep(0.1)
+        scheduler.cancel()
+        await asyncio.gather(scheduler, return_exceptions=True)
+        return runs
+
+    assert asyncio.run(scenario()) >= 3
+
+
+def queue_txs(node, count: int) -> list:
+    txs = [{"id": f"tx-{i}", "amount": i} for i in range(count)]
+    node.mempool.extend(txs)
+    return txs
+
+
+def test_flush_worker_waits_for_wake_up():
+    async def scenario():
+        node = make_node()
+        node.heavy_online = True
+        flushed = []
+
+        async def batch_flush(batch):
+            flushed.append(batch)
+
+        node.batch_flush = batch_flush
+        txs = queue_txs(node, 3)
+        worker = asyncio.create_task(node._flush_worker())
+        await asyncio.sleep(0.05)
+        before = list(flushed)
+        await node.request_flush()
+        await asyncio.sleep(0.05)
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        return before, flushed, txs
+
+    before, flushed, txs = asyncio.run(scenario())
+    assert before == []
+    assert flushed == [txs]
+
+
+def test_flush_worker_bounds_inflight_anchors():
+    async def scenario():
+        node = make_node()
+        node.heavy_online = True
+        release = asyncio.Event()
+        inflight = peak = 0
+
+        async def batch_flush(batch):
+            nonlocal inflight, peak
+            inflight += 1
+            peak = max(peak, inflight)
+            await release.wait()
+            inflight -= 1
+
+        node.batch_flush = batch_flush
+        queue_txs(node, medium.BATCH_SIZE * (medium.MAX_INFLIGHT_ANCHORS + 2))
+        worker = asyncio.create_task(node._flush_worker())
+        await node.request_flush()
+        await asyncio.sleep(0.05)
+        waiting = len(node.mempool)
+        release.set()
+        await asyncio.sleep(0.05)
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        return peak, waiting, len(node.mempool)
+
+    peak, waiting, left = asyncio.run(scenario())
+    assert peak == medium.MAX_INFLIGHT_ANCHORS
+    # The rest stays queued until a slot frees up
+    assert waiting == 2 * medium.BATCH_SIZE
+    assert left == 0
+
+
+def test_failed_anchor_requeues_batch_at_front():
+    class FailingSession:
+        def post(self, *args, **kwargs):
+            raise ConnectionError("heavy down")
+
+    async def scenario():
+        node = make_node()
+        node._session = FailingSession()
+        txs = queue_txs(node, 5)
+        batch = [node.mempool.popleft(), node.mempool.popleft()]
+        await node.batch_flush(batch)
+        return list(node.mempool), txs
+
+    mempool, txs = asyncio.run(scenario())
+    # Back at the front, in their original order
+    assert mempool == txs
+
+
+def test_batch_anchor_hashes_stdlib_json_bytes():
+    posted = {}
+
+    class Response:
+        status = 200
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+    class RecordingSession:
+        def post(self, url, data, **kwargs):
+            posted.update(medium.orjson.loads(data))
+            return Response()
+
+    async def scenario():
+        node = make_node()
+        node._session = RecordingSession()
+        await node.batch_flush([{"id": "tx-1", "memo": "café", "amount": 1}])
+
+    asyncio.run(scenario())
+    leaves = medium.json.loads(posted["serialized_leaves"])
+    # The Heavy node verifies the roots against these exact strings
+    assert posted["serialized_leaves"] == medium.json.dumps(leaves)
+    assert leaves[0]["tx_data"] == '{"id": "tx-1", "memo": "caf\\u00e9", "amount": 1}'
+    assert bytes(posted["batch_root"]) == medium.hashlib.sha256(
+        posted["serialized_leaves"].encode()
+    ).digest()
+
+
+class FakeRequest:
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+def submit(node, tx: dict):
+    return asyncio.run(node.submit_tx(FakeRequest(medium.orjson.dumps(tx))))
+
+
+def test_submit_wakes_flush_worker_once_a_batch_is_queued():
+    node = make_node()
+    # e.g. after a failed anchor was re-queued: not a multiple of BATCH_SIZE
+    queue_txs(node, medium.BATCH_SIZE + 49)
+    submit(node, {"sender": "ouro1a", "recipient": "ouro1b", "amount": 1})
+    assert node._flush_event.is_set()
+
+
+def test_submit_below_batch_size_waits_for_timer():
+    node = make_node()
+    submit(node, {"sender": "ouro1a", "recipient": "ouro1b", "amount": 1})
+    assert not node._flush_event.is_set()
+
+
+def test_submit_rejects_missing_or_negative_amount():
+    node = make_node()
+    for tx in (
+        {"sender": "ouro1a", "recipient": "ouro1b"},
+        {"sender": "ouro1a", "recipient": "ouro1b", "amount": -1},
+        {"sender": "ouro1a", "recipient": "ouro1b", "amount": "5"},
+    ):
+        resp = submit(node, tx)
+        assert resp.status == 400, tx
+        assert "amount" in medium.orjson.loads(resp.body)["error"]
+    assert not node.mempool
+
+
+def test_submit_queues_tx_with_extra_fields_untouched():
+    node = make_node()
+    tx = {"sender": "ouro1a", "recipient": "ouro1b", "amount": 0, "memo": "hi"}
+    resp = submit(node, tx)
+    assert resp.status == 200
+    assert medium.orjson.loads(resp.body)["status"] == "queued"
+    assert list(node.mempool) == [tx]
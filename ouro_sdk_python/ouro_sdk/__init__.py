@@ -8,6 +8,8 @@ Build decentralized applications on the Ouroboros blockchain platform.
 """
 
 from .client import OuroClient
+from ._breaker import CircuitBreaker
+from .async_client import AsyncOuroClient, AsyncMicrochain, AsyncSubchain, gather_balances
 from .microchain import Microchain, MicrochainBuilder
 from .subchain import (
     Subchain,
@@ -19,10 +21,16 @@ from .subchain import (
     MIN_SUBCHAIN_DEPOSIT,
     RENT_RATE_PER_BLOCK,
 )
-from .transaction import Transaction, TransactionBuilder
+from .transaction import Signer, Transaction, TransactionBuilder
 from .types import (
     ConsensusType,
     TxStatus,
+    CONSENSUS_SINGLE_VALIDATOR,
+    CONSENSUS_BFT,
+    TX_PENDING,
+    TX_CONFIRMED,
+    TX_FAILED,
+    TX_ANCHORED,
     MicrochainConfig,
     MicrochainState,
     Balance,
@@ -38,6 +46,7 @@ from .errors import (
     InsufficientBalanceError,
     InvalidSignatureError,
     AnchorFailedError,
+    EventStreamUnsupportedError,
     InvalidConfigError,
 )
 
@@ -45,10 +54,17 @@ __version__ = "0.4.0"
 __all__ = [
     # Core classes
     "OuroClient",
+    "CircuitBreaker",
     "Microchain",
     "MicrochainBuilder",
+    "Signer",
     "Transaction",
     "TransactionBuilder",
+    # Async classes (require the "async" extra)
+    "AsyncOuroClient",
+    "AsyncMicrochain",
+    "AsyncSubchain",
+    "gather_balances",
     # Subchain classes
     "Subchain",
     "SubchainBuilder",
@@ -61,6 +77,12 @@ __all__ = [
     # Types
     "ConsensusType",
     "TxStatus",
+    "CONSENSUS_SINGLE_VALIDATOR",
+    "CONSENSUS_BFT",
+    "TX_PENDING",
+    "TX_CONFIRMED",
+    "TX_FAILED",
+    "TX_ANCHORED",
     "MicrochainConfig",
     "MicrochainState",
     "Balance",
@@ -75,5 +97,6 @@ __all__ = [
     "InsufficientBalanceError",
     "InvalidSignatureError",
     "AnchorFailedError",
+    "EventStreamUnsupportedError",
     "InvalidConfigError",
 ]
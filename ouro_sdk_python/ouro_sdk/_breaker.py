@@ -0,0 +1,59 @@
+"""Circuit breaker for failing fast while a node is unreachable"""
+
+import threading
+import time
+
+from .errors import NetworkError
+
+
+class CircuitBreaker:
+    """
+    Context manager that short-circuits calls to a node that keeps failing
+
+    - CLOSED: calls pass through; ``failure_threshold`` consecutive failures open it
+    - OPEN: calls raise NetworkError immediately for ``recovery_time`` seconds
+    - HALF_OPEN: one trial call is let through; success closes, failure re-opens
+
+    Example:
+        >>> client = OuroClient("http://localhost:8001", circuit_breaker=CircuitBreaker())
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "CircuitBreaker":
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                # A trial call is already in flight
+                raise NetworkError("circuit open")
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_time:
+                    raise NetworkError("circuit open")
+                self.state = self.HALF_OPEN
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        with self._lock:
+            if exc_type is None:
+                self.state = self.CLOSED
+                self._failures = 0
+            elif not issubclass(exc_type, Exception):
+                # Interrupted (e.g. KeyboardInterrupt), not a node failure:
+                # let the next call take the trial instead
+                if self.state == self.HALF_OPEN:
+                    self.state = self.OPEN
+            else:
+                self._failures += 1
+                if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                    self.state = self.OPEN
+                    self._opened_at = time.monotonic()
+        return False
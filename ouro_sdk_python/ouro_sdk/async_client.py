@@ -0,0 +1,259 @@
+"""Asyncio client for interacting with Ouroboros network
+
+Requires the optional ``async`` extra (``pip install ouroboros-sdk[async]``).
+"""
+
+import asyncio
+import itertools
+from contextlib import nullcontext
+from typing import List, Optional, Union
+
+import orjson
+
+from ._breaker import CircuitBreaker
+from .subchain import SubchainStatus
+from .transaction import Transaction, TransactionBuilder
+from .types import (
+    Balance,
+    TxStatus,
+    MicrochainState,
+    TransactionData,
+    BlockHeader,
+)
+from .errors import NetworkError, TransactionFailedError
+
+# Imported by the first AsyncOuroClient(), so sync-only users never load it
+aiohttp = None
+
+
+def _import_aiohttp() -> None:
+    global aiohttp
+    if aiohttp is None:
+        try:
+            import aiohttp as module
+        except ImportError:
+            raise ImportError(
+                "AsyncOuroClient requires aiohttp: pip install ouroboros-sdk[async]"
+            )
+        aiohttp = module
+
+
+class AsyncOuroClient:
+    """Async twin of OuroClient for fanning out many independent calls
+
+    Example:
+        >>> async with AsyncOuroClient("http://localhost:8001") as client:
+        ...     balances = await gather_balances(client, ["ouro1a...", "ouro1b..."])
+    """
+
+    def __init__(
+        self,
+        node_url: str,
+        api_key: str = None,
+        concurrency: int = 32,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        _import_aiohttp()
+        self.base_url = node_url.rstrip("/")
+        self.api_key = api_key
+        self.concurrency = concurrency
+        self.headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            self.headers["Authorization"] = f"Bearer {self.api_key}"
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._breaker = circuit_breaker if circuit_breaker is not None else nullcontext()
+
+    async def __aenter__(self) -> "AsyncOuroClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Release pooled connections"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        # Created lazily so the session binds to the caller's running loop
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=32, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._session
+
+    async def _request(self, method: str, url: str, allow_404: bool = False, **kwargs):
+        """Send a request and return the decoded JSON body (None on an allowed 404)"""
+        if "json" in kwargs:
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"))
+        try:
+            # Only transport failures count against the breaker, not HTTP errors
+            with self._breaker:
+                async with self._get_session().request(method, url, **kwargs) as response:
+                    body = await response.read()
+            if allow_404 and response.status == 404:
+                return None
+            response.raise_for_status()
+        except aiohttp.ClientError as e:
+            raise NetworkError(str(e))
+        except asyncio.TimeoutError:
+            raise NetworkError(f"{method} {url} timed out")
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            raise NetworkError(f"Invalid JSON response: {e}")
+
+    async def get_balance(self, address: str) -> Balance:
+        """Get mainchain balance for address"""
+        data = await self._request("GET", f"{self.base_url}/balance/{address}")
+        return Balance(address=address, balance=data["balance"], pending=data.get("pending", 0))
+
+    async def get_microchain_balance(self, microchain_id: str, address: str) -> int:
+        """Get microchain balance"""
+        url = f"{self.base_url}/microchain/{microchain_id}/balance/{address}"
+        # API might return 404 for new addresses on microchains
+        data = await self._request("GET", url, allow_404=True)
+        return 0 if data is None else data["balance"]
+
+    async def submit_transaction(self, tx: TransactionData) -> str:
+        """Submit transaction to mainchain"""
+        data = await self._request("POST", f"{self.base_url}/tx/submit", json=tx.to_dict())
+        if data.get("success"):
+            return data["tx_id"]
+        raise TransactionFailedError(data.get("message", "Unknown error"))
+
+    async def get_transaction_status(self, tx_id: str) -> TxStatus:
+        """Get transaction status"""
+        data = await self._request("GET", f"{self.base_url}/tx/{tx_id}")
+        return data["status"]
+
+    async def get_microchain_state(self, microchain_id: str) -> MicrochainState:
+        """Get microchain state"""
+        data = await self._request("GET", f"{self.base_url}/microchain/{microchain_id}/state")
+        return MicrochainState.from_dict(data)
+
+    async def list_microchains(self) -> List[MicrochainState]:
+        """List all microchains"""
+        data = await self._request("GET", f"{self.base_url}/microchains")
+        return [MicrochainState.from_dict(mc) for mc in data["microchains"]]
+
+    async def health_check(self) -> bool:
+        """Check node health"""
+        try:
+            with self._breaker:
+                async with self._get_session().get(f"{self.base_url}/health") as response:
+                    return 200 <= response.status < 300
+        except (aiohttp.ClientError, asyncio.TimeoutError, NetworkError):
+            return False
+
+    def microchain(self, microchain_id: str) -> "AsyncMicrochain":
+        """Get an async handle to an existing microchain"""
+        return AsyncMicrochain(microchain_id, self)
+
+    def subchain(self, subchain_id: str) -> "AsyncSubchain":
+        """Get an async handle to an existing subchain"""
+        return AsyncSubchain(subchain_id, self)
+
+
+class AsyncMicrochain:
+    """Async microchain interface sharing its client's session"""
+
+    def __init__(self, microchain_id: str, client: AsyncOuroClient, nonce: int = 0):
+        self.id = microchain_id
+        self._client = client
+        self._nonce_iter = itertools.count(nonce)
+
+    async def state(self) -> MicrochainState:
+        """Get microchain state"""
+        return await self._client.get_microchain_state(self.id)
+
+    async def balance(self, address: str) -> int:
+        """Get balance for an address on this microchain"""
+        return await self._client.get_microchain_balance(self.id, address)
+
+    def tx(self) -> TransactionBuilder:
+        """Create a transaction builder carrying this microchain's next nonce"""
+        return TransactionBuilder().set_nonce(next(self._nonce_iter))
+
+    async def submit_tx(self, tx: Transaction) -> str:
+        """Submit a transaction to this microchain"""
+        url = f"{self._client.base_url}/microchain/{self.id}/tx"
+        data = await self._client._request("POST", url, json=tx.to_json().to_dict())
+        if data.get("success"):
+            return data["tx_id"]
+        raise TransactionFailedError(data.get("message", "Unknown error"))
+
+    async def tx_history(self, from_block: int, to_block: int) -> List[TransactionData]:
+        """Get transaction history for this microchain"""
+        url = f"{self._client.base_url}/microchain/{self.id}/txs"
+        data = await self._client._request(
+            "GET", url, params={"from": from_block, "to": to_block}
+        )
+        return [TransactionData.from_dict(tx) for tx in data["transactions"]]
+
+    async def blocks(self, limit: int) -> List[BlockHeader]:
+        """Get latest blocks from this microchain"""
+        url = f"{self._client.base_url}/microchain/{self.id}/blocks"
+        data = await self._client._request("GET", url, params={"limit": limit})
+        return [BlockHeader.from_dict(block) for block in data["blocks"]]
+
+
+class AsyncSubchain:
+    """Async subchain interface sharing its client's session"""
+
+    def __init__(self, subchain_id: str, client: AsyncOuroClient, nonce: int = 0):
+        self.id = subchain_id
+        self._client = client
+        self._nonce_iter = itertools.count(nonce)
+
+    async def status(self) -> SubchainStatus:
+        """Get subchain status"""
+        url = f"{self._client.base_url}/subchain/{self.id}/status"
+        return SubchainStatus.from_dict(await self._client._request("GET", url))
+
+    async def balance(self, address: str) -> int:
+        """Get balance for an address on this subchain"""
+        url = f"{self._client.base_url}/subchain/{self.id}/balance/{address}"
+        return (await self._client._request("GET", url))["balance"]
+
+    def tx(self) -> TransactionBuilder:
+        """Create a transaction builder carrying this subchain's next nonce"""
+        return TransactionBuilder().set_nonce(next(self._nonce_iter))
+
+    async def submit_tx(self, tx: Transaction) -> str:
+        """Submit a transaction to this subchain"""
+        url = f"{self._client.base_url}/subchain/{self.id}/tx"
+        data = await self._client._request("POST", url, json=tx.to_json().to_dict())
+        if data.get("success"):
+            return data["tx_id"]
+        raise TransactionFailedError(data.get("message", "Unknown error"))
+
+    async def tx_history(self, from_block: int, to_block: int) -> List[dict]:
+        """Get transaction history"""
+        url = f"{self._client.base_url}/subchain/{self.id}/txs"
+        data = await self._client._request(
+            "GET", url, params={"from": from_block, "to": to_block}
+        )
+        return data["transactions"]
+
+
+async def gather_balances(
+    client: AsyncOuroClient, addresses: List[str], concurrency: Optional[int] = None
+) -> List[Union[Balance, BaseException]]:
+    """
+    Fetch balances for many addresses concurrently
+
+    At most ``concurrency`` requests (default: the client's setting) are in
+    flight at once. Results are aligned with ``addresses``; a failed lookup
+    yields its exception instead of a Balance.
+    """
+    limit = asyncio.Semaphore(concurrency or client.concurrency)
+
+    async def fetch(address: str) -> Balance:
+        async with limit:
+            return await client.get_balance(address)
+
+    return await asyncio.gather(*(fetch(a) for a in addresses), return_exceptions=True)
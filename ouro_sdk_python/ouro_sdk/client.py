@@ -1,72 +1,366 @@
 """HTTP client for interacting with Ouroboros network"""
 
+import gzip
+import threading
+import time
+import warnings
+import weakref
+from contextlib import ExitStack, contextmanager, nullcontext
+import msgspec
+import orjson
 import requests
-from typing import List, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple, Type
+from ._breaker import CircuitBreaker
+from ._cache import TTLCache
 from .types import (
     Balance,
     TxStatus,
+    TX_PENDING,
     MicrochainState,
     MicrochainConfig,
     TransactionData,
     Resources,
     BlockHeader,
+    page_decoder,
+    record_decoder,
 )
 from .errors import (
     NetworkError,
     TransactionFailedError,
     AnchorFailedError,
     SdkError,
+    InvalidConfigError,
+    EventStreamUnsupportedError,
 )
 
 
+# Responses from nodes that don't implement POST /batch
+BATCH_UNSUPPORTED_STATUS = (400, 404, 405, 501)
+
+NDJSON = "application/x-ndjson"
+
+# Responses from nodes without server-sent event support for a topic
+EVENTS_UNSUPPORTED_STATUS = (404, 415)
+
+TRANSPORTS = ("requests", "requestx", "httpx")
+
+# Transient node/gateway failures worth retrying (Retry-After is honoured)
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# The only statuses a POST is resent on, and only when they carry Retry-After:
+# the node is telling us it turned the request away without acting on it
+POST_RETRY_STATUS = (429, 503)
+
+# Default-configured clients handed out by OuroClient.get_or_create, keyed by
+# base URL; an entry lives as long as some handle still references its client
+_shared_clients: "weakref.WeakValueDictionary[str, OuroClient]" = weakref.WeakValueDictionary()
+_shared_clients_lock = threading.Lock()
+
+
+class _Retry(Retry):
+    """
+    urllib3 Retry that never resends a POST the node may have acted on
+
+    GET and DELETE are retried on RETRY_STATUS and read errors. A POST is only
+    retried on connect errors (urllib3 does that for any method) and on a
+    POST_RETRY_STATUS response with Retry-After.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method == "POST":
+            return bool(self.total) and has_retry_after and status_code in POST_RETRY_STATUS
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _make_session(
+    transport: str, http2: bool = False, pool_maxsize: int = 64, retries: int = 5
+) -> Tuple[Any, Tuple[Type[Exception], ...], str]:
+    """
+    Build the HTTP session for a transport
+
+    Returns the session, the exception types it raises and the request
+    keyword that takes a pre-encoded body.
+    """
+    if transport == "requests":
+        session = requests.Session()
+        # Keep-alive pool shared by this client and any Microchain/Subchain
+        # built on it, sized for multi-threaded callers
+        retry = _Retry(
+            total=retries,
+            backoff_factor=0.2,
+            status_forcelist=RETRY_STATUS,
+            allowed_methods=frozenset(["GET", "DELETE"]),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_maxsize, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session, (requests.RequestException,), "data"
+
+    if transport == "requestx":
+        try:
+            import requestx
+        except ImportError:
+            raise ImportError('transport="requestx" requires: pip install ouroboros-sdk[fast]')
+        # requests-compatible API backed by a Rust HTTP stack
+        return requestx.Session(), (
+            getattr(requestx, "RequestException", requests.RequestException),
+        ), "data"
+
+    if transport == "httpx":
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                'transport="httpx" requires: pip install ouroboros-sdk[httpx] '
+                "(or ouroboros-sdk[http2] for http2=True)"
+            )
+        # With http2=True concurrent calls multiplex over one TLS connection
+        client = httpx.Client(
+            http2=http2,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=30.0,
+        )
+        # httpx takes raw bytes as content=; data= is deprecated for them
+        return client, (httpx.HTTPError,), "content"
+
+    raise InvalidConfigError(f"Unknown transport {transport!r}, expected one of {TRANSPORTS}")
+
+
 class OuroClient:
     """Main client for interacting with Ouroboros network"""
 
-    def __init__(self, node_url: str, api_key: str = None):
+    def __init__(
+        self,
+        node_url: str,
+        api_key: str = None,
+        transport: str = "requests",
+        cache_ttl: float = 2.0,
+        cache_size: int = 1024,
+        http2: bool = False,
+        pool_maxsize: int = 64,
+        retries: int = 5,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        gzip_threshold: Optional[int] = None,
+    ):
+        if http2:
+            # Only the httpx transport speaks HTTP/2
+            if transport not in ("requests", "httpx"):
+                raise InvalidConfigError(f"http2=True is not supported by transport {transport!r}")
+            transport = "httpx"
         self.base_url = node_url.rstrip("/")
         self.api_key = api_key
-        self.session = requests.Session()
-        headers = {"Content-Type": "application/json"}
+        # Endpoint URLs built once; per-call paths only append their argument
+        self._balance_url = self.base_url + "/balance/"
+        self._tx_url = self.base_url + "/tx/"
+        self._tx_submit_url = self.base_url + "/tx/submit"
+        self._batch_url = self.base_url + "/batch"
+        self._create_url = self.base_url + "/microchain/create"
+        self._microchains_url = self.base_url + "/microchains"
+        self._health_url = self.base_url + "/health"
+        self._resources_url = self.base_url + "/resources"
+        self._history_url = self.base_url + "/ouro/transactions/"
+        self._blocks_url = self.base_url + "/blocks"
+        self._events_url = self.base_url + "/events/"
+        self.transport = transport
+        self.session, self._http_errors, self._body_kwarg = _make_session(
+            transport, http2, pool_maxsize, retries
+        )
+        # Read-only lookups keyed by URL; any write clears it (cache_ttl=0 disables)
+        self._cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        # Fails calls fast while the node is down; retries above cover one-off blips
+        self._breaker = circuit_breaker if circuit_breaker is not None else nullcontext()
+        # Submit bodies larger than this many bytes are gzipped. Off by default:
+        # only enable it for nodes that accept Content-Encoding: gzip requests
+        self.gzip_threshold = gzip_threshold
+        headers = {"Content-Type": "application/json", "Accept-Encoding": "gzip, deflate"}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
         self.session.headers.update(headers)
 
+    @classmethod
+    def get_or_create(cls, node_url: str) -> "OuroClient":
+        """
+        Get the process-wide default client for a node
+
+        Every caller asking for the same node shares one session, so its
+        connection pool and DNS lookups are reused. Construct OuroClient
+        directly for an isolated pool or non-default options.
+        """
+        key = node_url.rstrip("/")
+        with _shared_clients_lock:
+            client = _shared_clients.get(key)
+            if client is None:
+                client = cls(key)
+                _shared_clients[key] = client
+            return client
+
+    def close(self) -> None:
+        """Release pooled connections"""
+        self.session.close()
+
+    def __enter__(self) -> "OuroClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        invalidate: bool = False,
+        **kwargs,
+    ) -> Any:
+        """
+        Send a request through the shared session, with an optional pre-encoded body
+
+        State-changing calls pass ``invalidate=True``: they may change any
+        balance/state held in the read cache, so it is cleared.
+        """
+        if invalidate:
+            self._cache.clear()
+        if "json" in kwargs:
+            # Encode with orjson rather than the transport's stdlib json
+            body = orjson.dumps(kwargs.pop("json"))
+        if body is not None:
+            kwargs[self._body_kwarg] = body
+        with self._breaker:
+            return self.session.request(method, url, **kwargs)
+
+    def _post_json(self, url: str, payload: Any) -> Any:
+        """POST payload as JSON, gzip-compressing bodies above gzip_threshold"""
+        body = orjson.dumps(payload)
+        if self.gzip_threshold is not None and len(body) > self.gzip_threshold:
+            # Level 1: most of the size win on JSON for a fraction of the CPU
+            body = gzip.compress(body, compresslevel=1)
+            return self._request(
+                "POST", url, body=body, invalidate=True, headers={"Content-Encoding": "gzip"}
+            )
+        return self._request("POST", url, body=body, invalidate=True)
+
+    @staticmethod
+    def _json(response: Any) -> Any:
+        """Decode a response body with orjson"""
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise NetworkError(f"Invalid JSON response: {e}")
+
+    @contextmanager
+    def _stream(self, url: str, **kwargs) -> Iterator[Any]:
+        """GET url without buffering the body"""
+        with ExitStack() as stack:
+            # The breaker covers getting a response, not what the caller does with it
+            with self._breaker:
+                if self.transport == "httpx":
+                    response = stack.enter_context(self.session.stream("GET", url, **kwargs))
+                else:
+                    response = stack.enter_context(self.session.get(url, stream=True, **kwargs))
+            yield response
+
+    def _iter_records(
+        self,
+        url: str,
+        key: str,
+        params: Optional[Dict[str, Any]] = None,
+        record_type: Optional[type] = None,
+    ) -> Iterator[Any]:
+        """
+        Yield the records of a list endpoint one at a time
+
+        Asks for NDJSON so records can be decoded as they arrive. Nodes that
+        answer with plain JSON are handled too: the records are then read
+        from ``response[key]`` once the whole body is in. With ``record_type``
+        (a msgspec Struct) records are decoded straight into it instead of
+        into dicts.
+        """
+        headers = {"Accept": f"{NDJSON}, application/json"}
+        try:
+            with self._stream(url, params=params, headers=headers) as response:
+                response.raise_for_status()
+                if response.headers.get("Content-Type", "").startswith(NDJSON):
+                    decode = record_decoder(record_type).decode if record_type else orjson.loads
+                    for line in response.iter_lines():
+                        if line:
+                            yield decode(line)
+                else:
+                    if self.transport == "httpx":
+                        response.read()
+                    if record_type:
+                        page = page_decoder(key, record_type).decode(response.content)
+                        yield from getattr(page, key)
+                    else:
+                        yield from self._json(response)[key]
+        except self._http_errors as e:
+            raise NetworkError(str(e))
+        except msgspec.MsgspecError as e:
+            raise NetworkError(f"Invalid response: {e}")
+        except orjson.JSONDecodeError as e:
+            raise NetworkError(f"Invalid JSON response: {e}")
+
     def get_balance(self, address: str) -> Balance:
         """Get mainchain balance for address"""
+        url = self._balance_url + address
+        cached = self._cache.get(url)
+        if cached is not None:
+            return cached
         try:
-            url = f"{self.base_url}/balance/{address}"
-            response = self.session.get(url)
+            response = self._request("GET", url)
             response.raise_for_status()
-            data = response.json()
+            data = self._json(response)
 
-            return Balance(
+            balance = Balance(
                 address=address, balance=data["balance"], pending=data.get("pending", 0)
             )
-        except requests.RequestException as e:
+            self._cache.set(url, balance)
+            return balance
+        except self._http_errors as e:
             raise NetworkError(str(e))
 
+    def batch_get_balances(self, addresses: List[str], batch_size: int = 100) -> List[Balance]:
+        """Get mainchain balances for many addresses, one /batch request per batch_size"""
+        return self._batch(
+            "get_balance",
+            "address",
+            addresses,
+            batch_size,
+            lambda address, data: Balance(
+                address=address, balance=data["balance"], pending=data.get("pending", 0)
+            ),
+            self.get_balance,
+        )
+
     def get_microchain_balance(self, microchain_id: str, address: str) -> int:
         """Get microchain balance"""
+        url = f"{self.base_url}/microchain/{microchain_id}/balance/{address}"
+        cached = self._cache.get(url)
+        if cached is not None:
+            return cached
         try:
-            url = f"{self.base_url}/microchain/{microchain_id}/balance/{address}"
-            response = self.session.get(url)
+            response = self._request("GET", url)
             # API might return 404 for new addresses on microchains
             if response.status_code == 404:
-                return 0
-            response.raise_for_status()
-            data = response.json()
+                balance = 0
+            else:
+                response.raise_for_status()
+                balance = self._json(response)["balance"]
 
-            return data["balance"]
-        except requests.RequestException as e:
+            self._cache.set(url, balance)
+            return balance
+        except self._http_errors as e:
             raise NetworkError(str(e))
 
     def submit_transaction(self, tx: TransactionData) -> str:
         """Submit transaction to mainchain"""
         try:
-            url = f"{self.base_url}/tx/submit"
-            response = self.session.post(url, json=tx.to_dict())
+            url = self._tx_submit_url
+            response = self._post_json(url, tx.to_dict())
             response.raise_for_status()
-            data = response.json()
+            data = self._json(response)
 
             if data.get("success"):
                 return data["tx_id"]
@@ -74,28 +368,89 @@ class OuroClient:
                 raise TransactionFailedError(data.get("message", "Unknown error"))
         except TransactionFailedError:
             raise
-        except requests.RequestException as e:
+        except self._http_errors as e:
             raise NetworkError(str(e))
 
     def get_transaction_status(self, tx_id: str) -> TxStatus:
         """Get transaction status"""
         try:
-            url = f"{self.base_url}/tx/{tx_id}"
-            response = self.session.get(url)
+            url = self._tx_url + tx_id
+            response = self._request("GET", url)
             response.raise_for_status()
-            data = response.json()
+            data = self._json(response)
 
-            return TxStatus(data["status"])
-        except requests.RequestException as e:
+            return data["status"]
+        except self._http_errors as e:
             raise NetworkError(str(e))
 
+    def batch_get_transaction_status(
+        self, tx_ids: List[str], batch_size: int = 100
+    ) -> List[TxStatus]:
+        """Get statuses for many transactions, one /batch request per batch_size"""
+        return self._batch(
+            "get_transaction_status",
+            "tx_id",
+            tx_ids,
+            batch_size,
+            lambda tx_id, data: data["status"],
+            self.get_transaction_status,
+        )
+
+    def _batch(
+        self,
+        method: str,
+        param: str,
+        values: List[str],
+        batch_size: int,
+        parse: Callable[[str, Dict[str, Any]], Any],
+        fallback: Callable[[str], Any],
+    ) -> List[Any]:
+        """
+        Run one single-argument call per value through POST /batch
+
+        Results are aligned with ``values``. Items the node answers with an
+        error are retried individually via ``fallback``; if the node doesn't
+        support /batch at all, every remaining value falls back.
+        """
+        url = self._batch_url
+        results: List[Any] = []
+        for start in range(0, len(values), batch_size):
+            chunk = values[start : start + batch_size]
+            try:
+                response = self._request(
+                    "POST",
+                    url,
+                    json={"requests": [{"method": method, "params": {param: v}} for v in chunk]},
+                )
+                if response.status_code in BATCH_UNSUPPORTED_STATUS:
+                    warnings.warn(
+                        f"{url} unavailable (HTTP {response.status_code}); "
+                        "falling back to per-item requests",
+                        RuntimeWarning,
+                        stacklevel=3,
+                    )
+                    results.extend(fallback(v) for v in values[start:])
+                    return results
+                response.raise_for_status()
+                items = self._json(response).get("responses", [])
+            except self._http_errors as e:
+                raise NetworkError(str(e))
+
+            for i, value in enumerate(chunk):
+                item = items[i] if i < len(items) else None
+                if item and "result" in item:
+                    results.append(parse(value, item["result"]))
+                else:
+                    results.append(fallback(value))
+        return results
+
     def create_microchain(self, config: MicrochainConfig) -> str:
         """Create a new microchain"""
         try:
-            url = f"{self.base_url}/microchain/create"
-            response = self.session.post(url, json=config.to_dict())
+            url = self._create_url
+            response = self._request("POST", url, invalidate=True, json=config.to_dict())
             response.raise_for_status()
-            data = response.json()
+            data = self._json(response)
 
             if data.get("success"):
                 return data["microchain_id"]
@@ -103,40 +458,48 @@ class OuroClient:
                 raise SdkError(data.get("message", "Failed to create microchain"))
         except SdkError:
             raise
-        except requests.RequestException as e:
+        except self._http_errors as e:
             raise NetworkError(str(e))
 
     def get_microchain_state(self, microchain_id: str) -> MicrochainState:
         """Get microchain state"""
+        url = f"{self.base_url}/microchain/{microchain_id}/state"
+        cached = self._cache.get(url)
+        if cached is not None:
+            return cached
         try:
-            url = f"{self.base_url}/microchain/{microchain_id}/state"
-            response = self.session.get(url)
+            response = self._request("GET", url)
             response.raise_for_status()
-            data = response.json()
 
-            return MicrochainState.from_dict(data)
-        except requests.RequestException as e:
+            state = record_decoder(MicrochainState).decode(response.content)
+            self._cache.set(url, state)
+            return state
+        except self._http_errors as e:
             raise NetworkError(str(e))
+        except msgspec.MsgspecError as e:
+            raise NetworkError(f"Invalid response: {e}")
 
     def list_microchains(self) -> List[MicrochainState]:
         """List all microchains"""
         try:
-            url = f"{self.base_url}/microchains"
-            response = self.session.get(url)
+            url = self._microchains_url
+            response = self._request("GET", url)
             response.raise_for_status()
-            data = response.json()
 
-            return [MicrochainState.from_dict(mc) for mc in data["microchains"]]
-        except requests.RequestException as e:
+            page = page_decoder("microchains", MicrochainState).decode(response.content)
+            return page.microchains
+        except self._http_errors as e:
             raise NetworkError(str(e))
+        except msgspec.MsgspecError as e:
+            raise NetworkError(f"Invalid response: {e}")
 
     def anchor_microchain(self, microchain_id: str) -> str:
         """Trigger manual anchor for a microchain"""
         try:
             url = f"{self.base_url}/microchain/{microchain_id}/anchor"
-            response = self.session.post(url)
+            response = self._request("POST", url, invalidate=True)
             response.raise_for_status()
-            data = response.json()
+            data = self._json(response)
 
             if data.get("success"):
                 return data["anchor_id"]
@@ -144,46 +507,109 @@ class OuroClient:
                 raise AnchorFailedError(data.get("message", "Unknown error"))
         except AnchorFailedError:
             raise
-        except requests.RequestException as e:
+        except self._http_errors as e:
             raise NetworkError(str(e))
 
     def health_check(self) -> bool:
         """Check node health"""
         try:
-            url = f"{self.base_url}/health"
-            response = self.session.get(url)
+            url = self._health_url
+            response = self._request("GET", url)
             return response.status_code >= 200 and response.status_code < 300
-        except requests.RequestException:
+        except self._http_errors + (NetworkError,):
             return False
 
     def get_resources(self) -> Resources:
         """Get node resource usage (CPU, RAM, Disk, Network)"""
         try:
-            url = f"{self.base_url}/resources"
-            response = self.session.get(url)
+            url = self._resources_url
+            response = self._request("GET", url)
             response.raise_for_status()
-            return Resources.from_dict(response.json())
-        except requests.RequestException as e:
+            return record_decoder(Resources).decode(response.content)
+        except self._http_errors as e:
             raise NetworkError(str(e))
+        except msgspec.MsgspecError as e:
+            raise NetworkError(f"Invalid response: {e}")
 
     def get_transaction_history(self, address: str, limit: int = 10) -> List[TransactionData]:
         """Get transaction history for an address"""
         try:
-            url = f"{self.base_url}/ouro/transactions/{address}"
-            response = self.session.get(url, params={"limit": limit})
+            url = self._history_url + address
+            response = self._request("GET", url, params={"limit": limit})
             response.raise_for_status()
-            data = response.json()
-            return [TransactionData.from_dict(tx) for tx in data["transactions"]]
-        except requests.RequestException as e:
+            page = page_decoder("transactions", TransactionData).decode(response.content)
+            return page.transactions
+        except self._http_errors as e:
             raise NetworkError(str(e))
+        except msgspec.MsgspecError as e:
+            raise NetworkError(f"Invalid response: {e}")
 
     def get_blocks(self, limit: int = 10) -> List[BlockHeader]:
         """Get recent blocks"""
         try:
-            url = f"{self.base_url}/blocks"
-            response = self.session.get(url, params={"limit": limit})
+            url = self._blocks_url
+            response = self._request("GET", url, params={"limit": limit})
             response.raise_for_status()
-            data = response.json()
-            return [BlockHeader.from_dict(b) for b in data["blocks"]]
-        except requests.RequestException as e:
+            return page_decoder("blocks", BlockHeader).decode(response.content).blocks
+        except self._http_errors as e:
             raise NetworkError(str(e))
+        except msgspec.MsgspecError as e:
+            raise NetworkError(f"Invalid response: {e}")
+
+    def stream_events(
+        self, topic: str, params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Subscribe to a node event stream (server-sent events)
+
+        Holds one HTTP response open and yields the decoded ``data`` of each
+        event as the node emits it, instead of polling.
+
+        Raises:
+            EventStreamUnsupportedError: the node does not serve this topic
+        """
+        url = self._events_url + topic
+        headers = {"Accept": "text/event-stream"}
+        try:
+            with self._stream(url, params=params, headers=headers) as response:
+                if response.status_code in EVENTS_UNSUPPORTED_STATUS:
+                    raise EventStreamUnsupportedError(topic)
+                response.raise_for_status()
+                data: List[str] = []
+                for line in response.iter_lines():
+                    if isinstance(line, bytes):
+                        line = line.decode("utf-8")
+                    if not line:
+                        # Blank line ends an event
+                        if data:
+                            yield orjson.loads("\n".join(data))
+                            data = []
+                    elif line.startswith("data:"):
+                        value = line[5:]
+                        data.append(value[1:] if value.startswith(" ") else value)
+        except self._http_errors as e:
+            raise NetworkError(str(e))
+        except orjson.JSONDecodeError as e:
+            raise NetworkError(f"Invalid JSON event: {e}")
+
+    def watch_tx(self, tx_id: str, poll_interval: float = 1.0) -> TxStatus:
+        """
+        Block until a transaction leaves the pending state and return its status
+
+        Follows the node's ``tx/{tx_id}`` event stream, or polls
+        get_transaction_status every ``poll_interval`` seconds when the node
+        has no event support.
+        """
+        try:
+            for event in self.stream_events(f"tx/{tx_id}"):
+                status = event["status"]
+                if status != TX_PENDING:
+                    return status
+        except EventStreamUnsupportedError:
+            pass
+
+        while True:
+            status = self.get_transaction_status(tx_id)
+            if status != TX_PENDING:
+                return status
+            time.sleep(poll_interval)
@@ -51,6 +51,14 @@ class AnchorFailedError(SdkError):
         super().__init__(f"Anchor failed: {message}")
 
 
+class EventStreamUnsupportedError(SdkError):
+    """Node does not serve the requested event stream"""
+
+    def __init__(self, topic: str):
+        self.topic = topic
+        super().__init__(f"Event stream not supported: {topic}")
+
+
 class InvalidConfigError(SdkError):
     """Invalid configuration error"""
 
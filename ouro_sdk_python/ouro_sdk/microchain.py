@@ -1,7 +1,7 @@
 """Microchain interface for building dApps"""
 
-from typing import List, Dict, Any, Optional
-import requests
+import itertools
+from typing import List, Dict, Any, Iterator, Optional
 from .client import OuroClient
 from .transaction import Transaction, TransactionBuilder
 from .types import (
@@ -10,6 +10,7 @@ from .types import (
     BlockHeader,
     TransactionData,
     ConsensusType,
+    CONSENSUS_SINGLE_VALIDATOR,
     AnchorFrequency,
 )
 from .errors import InvalidConfigError, TransactionFailedError
@@ -24,12 +25,19 @@ class Microchain:
         self.id = microchain_id
         self._client = client
         self._base_url = base_url
-        self._nonce = nonce
+        # Nonces are handed out as transactions are built; next() on a
+        # count is atomic under the GIL, so threads never share one
+        self._nonce_iter = itertools.count(nonce)
+        # Endpoint URLs are fixed per instance; build them once
+        prefix = f"{base_url}/microchain/{microchain_id}"
+        self._tx_url = prefix + "/tx"
+        self._txs_url = prefix + "/txs"
+        self._blocks_url = prefix + "/blocks"
 
     @classmethod
     def connect(cls, microchain_id: str, node_url: str) -> "Microchain":
         """Connect to an existing microchain"""
-        client = OuroClient(node_url)
+        client = OuroClient.get_or_create(node_url)
 
         # Verify microchain exists
         client.get_microchain_state(microchain_id)
@@ -39,7 +47,7 @@ class Microchain:
     @classmethod
     def create(cls, config: MicrochainConfig, node_url: str) -> "Microchain":
         """Create a new microchain"""
-        client = OuroClient(node_url)
+        client = OuroClient.get_or_create(node_url)
         microchain_id = client.create_microchain(config)
 
         return cls(microchain_id, client, node_url, 0)
@@ -55,13 +63,12 @@ class Microchain:
     def submit_tx(self, tx: Transaction) -> str:
         """Submit a transaction to this microchain"""
         try:
-            url = f"{self._base_url}/microchain/{self.id}/tx"
-            response = requests.post(url, json=tx.to_json().to_dict())
+            url = self._tx_url
+            response = self._client._post_json(url, tx.to_json().to_dict())
             response.raise_for_status()
-            data = response.json()
+            data = self._client._json(response)
 
             if data.get("success"):
-                self._nonce += 1
                 return data["tx_id"]
             else:
                 raise TransactionFailedError(data.get("message", "Unknown error"))
@@ -73,13 +80,13 @@ class Microchain:
     def tx(self) -> TransactionBuilder:
         """Create a transaction builder for this microchain"""
         builder = TransactionBuilder()
-        builder.set_nonce(self._nonce)
+        builder.set_nonce(next(self._nonce_iter))
         return builder
 
     def transfer(self, from_addr: str, to: str, amount: int) -> str:
         """Transfer tokens on this microchain (simplified)"""
         tx = Transaction(from_addr, to, amount)
-        tx.nonce = self._nonce
+        tx.nonce = next(self._nonce_iter)
 
         return self.submit_tx(tx)
 
@@ -87,27 +94,34 @@ class Microchain:
         """Anchor this microchain to subchain/mainchain"""
         return self._client.anchor_microchain(self.id)
 
+    def iter_tx_history(self, from_block: int, to_block: int) -> Iterator[TransactionData]:
+        """Stream transaction history for this microchain, one transaction at a time"""
+        url = self._txs_url
+        return self._client._iter_records(
+            url,
+            "transactions",
+            params={"from": from_block, "to": to_block},
+            record_type=TransactionData,
+        )
+
     def tx_history(self, from_block: int, to_block: int) -> List[TransactionData]:
         """Get transaction history for this microchain"""
         try:
-            url = f"{self._base_url}/microchain/{self.id}/txs?from={from_block}&to={to_block}"
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
-
-            return [TransactionData.from_dict(tx) for tx in data["transactions"]]
+            return list(self.iter_tx_history(from_block, to_block))
         except Exception as e:
             raise Exception(f"Failed to fetch history: {str(e)}")
 
+    def iter_blocks(self, limit: int) -> Iterator[BlockHeader]:
+        """Stream latest blocks from this microchain, one block at a time"""
+        url = self._blocks_url
+        return self._client._iter_records(
+            url, "blocks", params={"limit": limit}, record_type=BlockHeader
+        )
+
     def blocks(self, limit: int) -> List[BlockHeader]:
         """Get latest blocks from this microchain"""
         try:
-            url = f"{self._base_url}/microchain/{self.id}/blocks?limit={limit}"
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
-
-            return [BlockHeader.from_dict(block) for block in data["blocks"]]
+            return list(self.iter_blocks(limit))
         except Exception as e:
             raise Exception(f"Failed to fetch blocks: {str(e)}")
 
@@ -119,7 +133,7 @@ class MicrochainBuilder:
         self._config = MicrochainConfig(
             name=name,
             owner=owner,
-            consensus={"type": ConsensusType.SINGLE_VALIDATOR.value},
+            consensus={"type": CONSENSUS_SINGLE_VALIDATOR},
             anchor_frequency=AnchorFrequency.every_n_blocks(100),
             max_txs_per_block=1000,
             block_time_secs=5,
@@ -135,7 +149,7 @@ class MicrochainBuilder:
         self, consensus_type: ConsensusType, validator_count: Optional[int] = None
     ) -> "MicrochainBuilder":
         """Set consensus type"""
-        self._config.consensus = {"type": consensus_type.value}
+        self._config.consensus = {"type": consensus_type}
         if validator_count:
             self._config.consensus["validator_count"] = validator_count
         return self
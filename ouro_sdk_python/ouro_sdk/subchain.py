@@ -1,12 +1,15 @@
 """Subchain interface for building high-scale business applications"""
 
-from typing import List, Optional
+import itertools
+import time
+from typing import Iterator, List, Optional
 from dataclasses import dataclass
 from enum import Enum
-import requests
+import msgspec
 from .client import OuroClient
+from .types import _SLOTS, _convert
 from .transaction import Transaction, TransactionBuilder
-from .errors import InvalidConfigError, TransactionFailedError
+from .errors import EventStreamUnsupportedError, InvalidConfigError, TransactionFailedError
 
 
 # Minimum deposit required to create a subchain (5,000 OURO)
@@ -23,7 +26,7 @@ class SubchainState(Enum):
     TERMINATED = "terminated"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidatorConfig:
     """Validator configuration for subchain"""
     pubkey: str
@@ -31,13 +34,12 @@ class ValidatorConfig:
     endpoint: Optional[str] = None
 
     def to_dict(self) -> dict:
-        result = {"pubkey": self.pubkey, "stake": self.stake}
         if self.endpoint:
-            result["endpoint"] = self.endpoint
-        return result
+            return {"pubkey": self.pubkey, "stake": self.stake, "endpoint": self.endpoint}
+        return {"pubkey": self.pubkey, "stake": self.stake}
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SubchainConfig:
     """Subchain configuration"""
     name: str
@@ -80,9 +82,19 @@ class SubchainConfig:
                 f"Deposit must be at least {MIN_SUBCHAIN_DEPOSIT // 100_000_000} OURO"
             )
 
-
-@dataclass
-class SubchainStatus:
+    def to_dict(self) -> dict:
+        """Convert to dictionary for registration"""
+        return {
+            "name": self.name,
+            "owner": self.owner,
+            "deposit": self.deposit,
+            "anchor_frequency": self.anchor_frequency,
+            "rpc_endpoint": self.rpc_endpoint,
+            "validators": [v.to_dict() for v in self.validators],
+        }
+
+
+class SubchainStatus(msgspec.Struct, frozen=True):
     """Subchain status information"""
     id: str
     name: str
@@ -97,18 +109,10 @@ class SubchainStatus:
 
     @classmethod
     def from_dict(cls, data: dict) -> "SubchainStatus":
-        return cls(
-            id=data["id"],
-            name=data["name"],
-            owner=data["owner"],
-            state=SubchainState(data["state"]),
-            deposit_balance=data["deposit_balance"],
-            blocks_remaining=data["blocks_remaining"],
-            block_height=data["block_height"],
-            tx_count=data["tx_count"],
-            last_anchor_height=data.get("last_anchor_height"),
-            validator_count=data["validator_count"],
-        )
+        if "last_anchor_height" not in data:
+            # Not sent until the first anchor; positional order keeps it a required field
+            data = {**data, "last_anchor_height": None}
+        return _convert(data, cls)
 
 
 class Subchain:
@@ -136,7 +140,19 @@ class Subchain:
         self.id = subchain_id
         self._client = client
         self._base_url = base_url
-        self._nonce = nonce
+        # Nonces are handed out as transactions are built; next() on a
+        # count is atomic under the GIL, so threads never share one
+        self._nonce_iter = itertools.count(nonce)
+        # Endpoint URLs are fixed per instance; build them once
+        prefix = f"{base_url}/subchain/{subchain_id}"
+        self._status_url = prefix + "/status"
+        self._topup_url = prefix + "/topup"
+        self._balance_url = prefix + "/balance/"
+        self._tx_url = prefix + "/tx"
+        self._anchor_url = prefix + "/anchor"
+        self._txs_url = prefix + "/txs"
+        self._validators_url = prefix + "/validators"
+        self._withdraw_url = prefix + "/withdraw"
 
     @classmethod
     def connect(cls, subchain_id: str, node_url: str) -> "Subchain":
@@ -150,12 +166,12 @@ class Subchain:
         Returns:
             Connected Subchain instance
         """
-        client = OuroClient(node_url)
+        client = OuroClient.get_or_create(node_url)
 
         # Verify subchain exists
-        response = requests.get(f"{node_url}/subchain/{subchain_id}/status")
+        response = client._request("GET", f"{node_url}/subchain/{subchain_id}/status")
         response.raise_for_status()
-        data = response.json()
+        data = client._json(response)
 
         if not data.get("success", True):
             raise Exception(f"Subchain not found: {subchain_id}")
@@ -176,19 +192,14 @@ class Subchain:
         """
         config.validate()
 
-        client = OuroClient(node_url)
+        client = OuroClient.get_or_create(node_url)
 
         # Register subchain
-        response = requests.post(f"{node_url}/subchain/register", json={
-            "name": config.name,
-            "owner": config.owner,
-            "deposit": config.deposit,
-            "anchor_frequency": config.anchor_frequency,
-            "rpc_endpoint": config.rpc_endpoint,
-            "validators": [v.to_dict() for v in config.validators],
-        })
+        response = client._request(
+            "POST", f"{node_url}/subchain/register", invalidate=True, json=config.to_dict()
+        )
         response.raise_for_status()
-        data = response.json()
+        data = client._json(response)
 
         if not data.get("success"):
             raise Exception(data.get("message", "Failed to register subchain"))
@@ -197,9 +208,44 @@ class Subchain:
 
     def status(self) -> SubchainStatus:
         """Get subchain status"""
-        response = requests.get(f"{self._base_url}/subchain/{self.id}/status")
+        url = self._status_url
+        cached = self._client._cache.get(url)
+        if cached is not None:
+            return cached
+        response = self._client._request("GET", url)
         response.raise_for_status()
-        return SubchainStatus.from_dict(response.json())
+        status = SubchainStatus.from_dict(self._client._json(response))
+        self._client._cache.set(url, status)
+        return status
+
+    def watch_status(self, poll_interval: float = 2.0) -> Iterator[SubchainStatus]:
+        """
+        Yield the subchain status each time it changes
+
+        Follows the node's ``subchain/{id}/status`` event stream, reconnecting
+        after ``poll_interval`` seconds whenever the node closes it, or polls
+        status() every ``poll_interval`` seconds when the node has no event
+        support.
+        """
+        last = None
+        try:
+            while True:
+                for event in self._client.stream_events(f"subchain/{self.id}/status"):
+                    status = SubchainStatus.from_dict(event)
+                    if status != last:
+                        yield status
+                        last = status
+                # Stream closed (node restart, proxy idle timeout): pick it up again
+                time.sleep(poll_interval)
+        except EventStreamUnsupportedError:
+            pass
+
+        while True:
+            status = self.status()
+            if status != last:
+                yield status
+                last = status
+            time.sleep(poll_interval)
 
     def deposit_balance(self) -> int:
         """Get current deposit balance"""
@@ -219,12 +265,14 @@ class Subchain:
         Returns:
             Transaction ID
         """
-        response = requests.post(
-            f"{self._base_url}/subchain/{self.id}/topup",
+        response = self._client._request(
+            "POST",
+            self._topup_url,
+            invalidate=True,
             json={"amount": amount}
         )
         response.raise_for_status()
-        data = response.json()
+        data = self._client._json(response)
 
         if not data.get("success"):
             raise Exception(data.get("message", "Failed to top up rent"))
@@ -241,11 +289,12 @@ class Subchain:
         Returns:
             Balance amount
         """
-        response = requests.get(
-            f"{self._base_url}/subchain/{self.id}/balance/{address}"
+        response = self._client._request(
+            "GET",
+            self._balance_url + address
         )
         response.raise_for_status()
-        return response.json()["balance"]
+        return self._client._json(response)["balance"]
 
     def submit_tx(self, tx: Transaction) -> str:
         """
@@ -258,13 +307,12 @@ class Subchain:
             Transaction ID
         """
         try:
-            url = f"{self._base_url}/subchain/{self.id}/tx"
-            response = requests.post(url, json=tx.to_dict())
+            url = self._tx_url
+            response = self._client._post_json(url, tx.to_json().to_dict())
             response.raise_for_status()
-            data = response.json()
+            data = self._client._json(response)
 
             if data.get("success"):
-                self._nonce += 1
                 return data["tx_id"]
             else:
                 raise TransactionFailedError(data.get("message", "Unknown error"))
@@ -276,7 +324,7 @@ class Subchain:
     def tx(self) -> TransactionBuilder:
         """Create a transaction builder for this subchain"""
         builder = TransactionBuilder()
-        builder.set_nonce(self._nonce)
+        builder.set_nonce(next(self._nonce_iter))
         return builder
 
     def transfer(self, from_addr: str, to: str, amount: int) -> str:
@@ -292,7 +340,7 @@ class Subchain:
             Transaction ID
         """
         tx = Transaction(from_addr, to, amount)
-        tx.nonce = self._nonce
+        tx.nonce = next(self._nonce_iter)
         return self.submit_tx(tx)
 
     def anchor(self) -> str:
@@ -302,15 +350,31 @@ class Subchain:
         Returns:
             Transaction ID
         """
-        response = requests.post(f"{self._base_url}/subchain/{self.id}/anchor")
+        response = self._client._request("POST", self._anchor_url, invalidate=True)
         response.raise_for_status()
-        data = response.json()
+        data = self._client._json(response)
 
         if not data.get("success"):
             raise Exception(data.get("message", "Failed to anchor"))
 
         return data["tx_id"]
 
+    def iter_tx_history(self, from_block: int, to_block: int) -> Iterator[dict]:
+        """
+        Stream transaction history without holding the whole range in memory
+
+        Args:
+            from_block: Start block
+            to_block: End block
+
+        Returns:
+            Iterator over transactions
+        """
+        url = self._txs_url
+        return self._client._iter_records(
+            url, "transactions", params={"from": from_block, "to": to_block}
+        )
+
     def tx_history(self, from_block: int, to_block: int) -> List[dict]:
         """
         Get transaction history
@@ -322,10 +386,7 @@ class Subchain:
         Returns:
             List of transactions
         """
-        url = f"{self._base_url}/subchain/{self.id}/txs?from={from_block}&to={to_block}"
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()["transactions"]
+        return list(self.iter_tx_history(from_block, to_block))
 
     def add_validator(self, validator: ValidatorConfig) -> str:
         """
@@ -337,12 +398,14 @@ class Subchain:
         Returns:
             Transaction ID
         """
-        response = requests.post(
-            f"{self._base_url}/subchain/{self.id}/validators",
+        response = self._client._request(
+            "POST",
+            self._validators_url,
+            invalidate=True,
             json=validator.to_dict()
         )
         response.raise_for_status()
-        data = response.json()
+        data = self._client._json(response)
 
         if not data.get("success"):
             raise Exception(data.get("message", "Failed to add validator"))
@@ -359,11 +422,13 @@ class Subchain:
         Returns:
             Transaction ID
         """
-        response = requests.delete(
-            f"{self._base_url}/subchain/{self.id}/validators/{pubkey}"
+        response = self._client._request(
+            "DELETE",
+            f"{self._validators_url}/{pubkey}",
+            invalidate=True
         )
         response.raise_for_status()
-        data = response.json()
+        data = self._client._json(response)
 
         if not data.get("success"):
             raise Exception(data.get("message", "Failed to remove validator"))
@@ -377,11 +442,12 @@ class Subchain:
         Returns:
             List of validator configurations
         """
-        response = requests.get(
-            f"{self._base_url}/subchain/{self.id}/validators"
+        response = self._client._request(
+            "GET",
+            self._validators_url
         )
         response.raise_for_status()
-        data = response.json()
+        data = self._client._json(response)
         return [
             ValidatorConfig(
                 pubkey=v["pubkey"],
@@ -398,11 +464,13 @@ class Subchain:
         Returns:
             Transaction ID
         """
-        response = requests.post(
-            f"{self._base_url}/subchain/{self.id}/withdraw"
+        response = self._client._request(
+            "POST",
+            self._withdraw_url,
+            invalidate=True
         )
         response.raise_for_status()
-        data = response.json()
+        data = self._client._json(response)
 
         if not data.get("success"):
             raise Exception(data.get("message", "Failed to withdraw deposit"))
@@ -1,26 +1,62 @@
 """Transaction building and signing"""
 
+import time
 import uuid
-from datetime import datetime
-from typing import Optional, Dict, Any
-import nacl.signing
-import nacl.encoding
+from typing import TYPE_CHECKING, Optional, Dict, Any, Union
 from .types import TransactionData
 from .errors import InvalidConfigError, InvalidSignatureError
 
+if TYPE_CHECKING:
+    import nacl.signing
+
+
+def _iso_now() -> str:
+    """Current UTC time as ISO-8601 with microseconds and a Z suffix"""
+    secs, ns = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(secs))}.{ns // 1000:06d}Z"
+
+
+class Signer:
+    """
+    A parsed private key for signing many transactions
+
+    Parsing the hex key is the costly part of signing. Build one Signer per
+    key and pass it to Transaction.sign in place of the hex string. The key
+    is held only by this object, for as long as the caller keeps it.
+    """
+
+    __slots__ = ("_key",)
+
+    def __init__(self, private_key_hex: str):
+        # Imported here so read-only users never load libsodium
+        import nacl.signing
+
+        try:
+            self._key: "nacl.signing.SigningKey" = nacl.signing.SigningKey(
+                bytes.fromhex(private_key_hex)
+            )
+        except Exception:
+            raise InvalidSignatureError()
+
+    def sign(self, message: bytes) -> bytes:
+        """Return the detached signature of message"""
+        return self._key.sign(message).signature
+
 
 class Transaction:
     """Transaction class for building and signing transactions"""
 
+    __slots__ = ("id", "from_addr", "to", "amount", "nonce", "signature", "data", "timestamp")
+
     def __init__(self, from_addr: str, to: str, amount: int):
-        self.id = str(uuid.uuid4())
+        self.id = uuid.uuid4().hex
         self.from_addr = from_addr
         self.to = to
         self.amount = amount
         self.nonce = 0
         self.signature = ""
         self.data: Optional[Dict[str, Any]] = None
-        self.timestamp = datetime.utcnow().isoformat() + "Z"
+        self.timestamp = _iso_now()
 
     def with_nonce(self, nonce: int) -> "Transaction":
         """Set transaction nonce"""
@@ -32,23 +68,25 @@ class Transaction:
         self.data = data
         return self
 
-    def sign(self, private_key_hex: str) -> "Transaction":
-        """Sign transaction with private key (hex string)"""
+    def sign(self, key: Union[str, Signer]) -> "Transaction":
+        """Sign transaction with a private key (hex string) or a reusable Signer"""
         try:
-            private_key_bytes = bytes.fromhex(private_key_hex)
-            signing_key = nacl.signing.SigningKey(private_key_bytes)
-
-            message = self._get_signing_message()
-            signature_bytes = signing_key.sign(message.encode()).signature
-
-            self.signature = signature_bytes.hex()
+            signer = key if isinstance(key, Signer) else Signer(key)
+            self.signature = signer.sign(self._get_signing_message()).hex()
             return self
         except Exception as e:
             raise InvalidSignatureError()
 
-    def _get_signing_message(self) -> str:
+    def _get_signing_message(self) -> bytes:
         """Get signing message"""
-        return f"{self.id}:{self.from_addr}:{self.to}:{self.amount}:{self.nonce}"
+        # str() like the original f-string, so non-int amounts sign the same bytes
+        return b"%s:%s:%s:%s:%s" % (
+            self.id.encode(),
+            self.from_addr.encode(),
+            self.to.encode(),
+            str(self.amount).encode(),
+            str(self.nonce).encode(),
+        )
 
     def to_json(self) -> TransactionData:
         """Convert to TransactionData for API submission"""
@@ -78,6 +116,8 @@ class Transaction:
 class TransactionBuilder:
     """Builder for creating transactions"""
 
+    __slots__ = ("_from", "_to", "_amount", "_nonce", "_data")
+
     def __init__(self):
         self._from: Optional[str] = None
         self._to: Optional[str] = None
@@ -1,27 +1,38 @@
 """Type definitions for the Ouroboros SDK"""
 
-from typing import Dict, Any, Optional, List, Union
-from enum import Enum
+import sys
+from functools import lru_cache
+from typing import Dict, Any, Final, Literal, Optional, List, Union
 from dataclasses import dataclass
+import msgspec
+from .errors import SdkError
 
+# dataclass(slots=True) for the high-volume records (Python 3.10+ only)
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-class ConsensusType(str, Enum):
-    """Consensus type for microchain"""
 
-    SINGLE_VALIDATOR = "single_validator"
-    BFT = "bft"
+def _convert(data: Any, cls: type) -> Any:
+    """Build cls from decoded JSON, leniently as record_decoder does"""
+    try:
+        return msgspec.convert(data, cls, strict=False)
+    except msgspec.ValidationError as e:
+        raise SdkError(f"Invalid {cls.__name__}: {e}")
 
 
-class TxStatus(str, Enum):
-    """Transaction status"""
+# Consensus type for microchain
+ConsensusType = Literal["single_validator", "bft"]
+CONSENSUS_SINGLE_VALIDATOR: Final = sys.intern("single_validator")
+CONSENSUS_BFT: Final = sys.intern("bft")
 
-    PENDING = "pending"
-    CONFIRMED = "confirmed"
-    FAILED = "failed"
-    ANCHORED = "anchored"
+# Transaction status, as reported by the node
+TxStatus = Literal["pending", "confirmed", "failed", "anchored"]
+TX_PENDING: Final = sys.intern("pending")
+TX_CONFIRMED: Final = sys.intern("confirmed")
+TX_FAILED: Final = sys.intern("failed")
+TX_ANCHORED: Final = sys.intern("anchored")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AnchorFrequency:
     """Anchor frequency configuration"""
 
@@ -50,7 +61,7 @@ class AnchorFrequency:
         return {"type": self.type, "count": self.count}
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MicrochainConfig:
     """Configuration for creating a microchain"""
 
@@ -63,21 +74,46 @@ class MicrochainConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API submission"""
-        config = {
-            "name": self.name,
-            "owner": self.owner,
-            "max_txs_per_block": self.max_txs_per_block,
-            "block_time_secs": self.block_time_secs,
-        }
-        if self.consensus:
-            config["consensus"] = self.consensus
-        if self.anchor_frequency:
-            config["anchor_frequency"] = self.anchor_frequency.to_dict()
-        return config
-
-
-@dataclass
-class MicrochainState:
+        return _MICROCHAIN_CONFIG_TO_DICT[
+            (2 if self.consensus else 0) | (1 if self.anchor_frequency else 0)
+        ](self)
+
+
+# MicrochainConfig.to_dict specialised on which optional fields are set
+# (bit 1: consensus, bit 0: anchor_frequency); each builds one dict literal
+_MICROCHAIN_CONFIG_TO_DICT = (
+    lambda c: {
+        "name": c.name,
+        "owner": c.owner,
+        "max_txs_per_block": c.max_txs_per_block,
+        "block_time_secs": c.block_time_secs,
+    },
+    lambda c: {
+        "name": c.name,
+        "owner": c.owner,
+        "max_txs_per_block": c.max_txs_per_block,
+        "block_time_secs": c.block_time_secs,
+        "anchor_frequency": c.anchor_frequency.to_dict(),
+    },
+    lambda c: {
+        "name": c.name,
+        "owner": c.owner,
+        "max_txs_per_block": c.max_txs_per_block,
+        "block_time_secs": c.block_time_secs,
+        "consensus": c.consensus,
+    },
+    lambda c: {
+        "name": c.name,
+        "owner": c.owner,
+        "max_txs_per_block": c.max_txs_per_block,
+        "block_time_secs": c.block_time_secs,
+        "consensus": c.consensus,
+        "anchor_frequency": c.anchor_frequency.to_dict(),
+    },
+)
+
+
+class MicrochainState(msgspec.Struct, frozen=True, rename="camel"):
     """Microchain state information"""
 
     id: str
@@ -88,22 +124,13 @@ class MicrochainState:
     created_at: str
     last_anchor_height: Optional[int] = None
 
-    @staticmethod
-    def from_dict(data: Dict[str, Any]) -> "MicrochainState":
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MicrochainState":
         """Create from dictionary"""
-        return MicrochainState(
-            id=data["id"],
-            name=data["name"],
-            owner=data["owner"],
-            block_height=data["blockHeight"],
-            tx_count=data["txCount"],
-            created_at=data["createdAt"],
-            last_anchor_height=data.get("lastAnchorHeight"),
-        )
-
-
-@dataclass
-class Balance:
+        return _convert(data, cls)
+
+
+class Balance(msgspec.Struct, frozen=True):
     """Balance information"""
 
     address: str
@@ -111,8 +138,7 @@ class Balance:
     pending: int
 
 
-@dataclass
-class BlockHeader:
+class BlockHeader(msgspec.Struct, frozen=True, rename="camel"):
     """Block header"""
 
     height: int
@@ -121,48 +147,33 @@ class BlockHeader:
     timestamp: str
     tx_count: int
 
-    @staticmethod
-    def from_dict(data: Dict[str, Any]) -> "BlockHeader":
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BlockHeader":
         """Create from dictionary"""
-        return BlockHeader(
-            height=data["height"],
-            hash=data["hash"],
-            previous_hash=data["previousHash"],
-            timestamp=data["timestamp"],
-            tx_count=data["txCount"],
-        )
-
-
-@dataclass
-class Resources:
-    """Node resource usage information"""
-
-    cpu_pct: float
-    mem_mb: int
-    disk_gb_used: float
-    disk_gb_total: float
-    net_in_kbps: float
-    net_out_kbps: float
+        return _convert(data, cls)
 
-    @staticmethod
-    def from_dict(data: Dict[str, Any]) -> "Resources":
+
+class Resources(msgspec.Struct, frozen=True):
+    """Node resource usage information (None where the node can't read a metric)"""
+
+    cpu_pct: Optional[float]
+    mem_mb: Optional[float]
+    disk_gb_used: Optional[float]
+    disk_gb_total: Optional[float]
+    net_in_kbps: Optional[float]
+    net_out_kbps: Optional[float]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Resources":
         """Create from dictionary"""
-        return Resources(
-            cpu_pct=data["cpu_pct"],
-            mem_mb=data["mem_mb"],
-            disk_gb_used=data["disk_gb_used"],
-            disk_gb_total=data["disk_gb_total"],
-            net_in_kbps=data["net_in_kbps"],
-            net_out_kbps=data["net_out_kbps"],
-        )
-
-
-@dataclass
-class TransactionData:
+        return _convert(data, cls)
+
+
+class TransactionData(msgspec.Struct, frozen=True):
     """Transaction data"""
 
     id: str
-    from_addr: str
+    from_addr: str = msgspec.field(name="from")
     to: str
     amount: int
     nonce: int
@@ -172,30 +183,38 @@ class TransactionData:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API submission"""
-        tx_dict = {
-            "id": self.id,
-            "from": self.from_addr,
-            "to": self.to,
-            "amount": self.amount,
-            "nonce": self.nonce,
-            "signature": self.signature,
-        }
-        if self.data:
-            tx_dict["data"] = self.data
-        if self.timestamp:
-            tx_dict["timestamp"] = self.timestamp
-        return tx_dict
-
-    @staticmethod
-    def from_dict(data: Dict[str, Any]) -> "TransactionData":
+        tx = msgspec.to_builtins(self)
+        # Optional fields are only sent when set
+        if not self.data:
+            del tx["data"]
+        if not self.timestamp:
+            del tx["timestamp"]
+        return tx
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TransactionData":
         """Create from dictionary"""
-        return TransactionData(
-            id=data["id"],
-            from_addr=data["from"],
-            to=data["to"],
-            amount=data["amount"],
-            nonce=data["nonce"],
-            signature=data["signature"],
-            data=data.get("data"),
-            timestamp=data.get("timestamp"),
-        )
+        return _convert(data, cls)
+
+
+@lru_cache(maxsize=None)
+def record_decoder(record_type: type) -> msgspec.json.Decoder:
+    """
+    Decoder for a single ``record_type`` JSON document
+
+    Non-strict, so numbers the node sends as strings or integral floats
+    still decode.
+    """
+    return msgspec.json.Decoder(record_type, strict=False)
+
+
+@lru_cache(maxsize=None)
+def page_decoder(key: str, record_type: type) -> msgspec.json.Decoder:
+    """
+    Decoder for a ``{key: [record, ...]}`` response body
+
+    Decodes the raw bytes straight into ``record_type`` instances in one pass;
+    other top-level fields are ignored.
+    """
+    page = msgspec.defstruct(f"{record_type.__name__}Page", [(key, List[record_type])])
+    return msgspec.json.Decoder(page, strict=False)
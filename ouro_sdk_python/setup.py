@@ -6,6 +6,8 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests>=2.31.0",
+        "orjson>=3.9.0",
+        "msgspec>=0.18.0",
         "pynacl>=1.5.0",
         "typing-extensions>=4.0.0",
     ],
@@ -0,0 +1,86 @@
+"""Shared fixtures: a local HTTP server standing in for an Ouroboros node"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, NamedTuple, Tuple, Union
+
+import pytest
+
+
+class Request(NamedTuple):
+    method: str
+    path: str
+    headers: Dict[str, str]
+    body: bytes
+
+
+# (status, body, headers); dict/list bodies are sent as JSON
+Reply = Tuple[int, Union[bytes, str, dict, list], Dict[str, str]]
+
+
+class FakeNode:
+    """Routes canned replies by (method, path) and records every request"""
+
+    def __init__(self) -> None:
+        self.url = ""
+        self.requests: List[Request] = []
+        self._routes: Dict[Tuple[str, str], List[Reply]] = {}
+
+    def route(self, method: str, path: str, *replies: Any) -> None:
+        """
+        Answer method+path with replies in turn, repeating the last one
+
+        Each reply is a body (sent as 200) or a (status, body[, headers]) tuple.
+        """
+        self._routes[(method, path)] = [
+            (r + ({},))[:3] if isinstance(r, tuple) else (200, r, {}) for r in replies
+        ]
+
+    def hits(self, method: str, path: str) -> int:
+        return sum(1 for r in self.requests if (r.method, r.path.split("?")[0]) == (method, path))
+
+    def reply(self, method: str, path: str) -> Reply:
+        replies = self._routes.get((method, path.split("?")[0]))
+        if not replies:
+            return 404, {"error": "not found"}, {}
+        return replies.pop(0) if len(replies) > 1 else replies[0]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    node: FakeNode
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _handle(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.node.requests.append(Request(self.command, self.path, dict(self.headers), body))
+        status, payload, headers = self.node.reply(self.command, self.path)
+        if isinstance(payload, (dict, list)):
+            payload = json.dumps(payload)
+        if isinstance(payload, str):
+            payload = payload.encode()
+        self.send_response(status)
+        headers = {"Content-Type": "application/json", **headers}
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_DELETE = _handle
+
+
+@pytest.fixture
+def node():
+    fake = FakeNode()
+    handler = type("Handler", (_Handler,), {"node": fake})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    fake.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield fake
+    server.shutdown()
+    server.server_close()
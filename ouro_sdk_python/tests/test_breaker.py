@@ -0,0 +1,97 @@
+"""CircuitBreaker state transitions"""
+
+import pytest
+
+from ouro_sdk import CircuitBreaker, NetworkError, OuroClient
+from ouro_sdk import _breaker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(_breaker, "time", fake)
+    return fake
+
+
+def fail(breaker: CircuitBreaker) -> None:
+    with pytest.raises(ConnectionError):
+        with breaker:
+            raise ConnectionError("node down")
+
+
+def test_opens_after_threshold_and_fails_fast(clock):
+    breaker = CircuitBreaker(failure_threshold=2, recovery_time=10)
+    fail(breaker)
+    assert breaker.state == CircuitBreaker.CLOSED
+    fail(breaker)
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(NetworkError):
+        with breaker:
+            pytest.fail("call let through while open")
+
+
+def test_half_open_trial_success_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=10)
+    fail(breaker)
+    clock.now += 10
+    with breaker:
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        # Only one trial call at a time
+        with pytest.raises(NetworkError):
+            with breaker:
+                pass
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_trial_failure_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=10)
+    fail(breaker)
+    clock.now += 10
+    fail(breaker)
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += 9
+    with pytest.raises(NetworkError):
+        with breaker:
+            pass
+
+
+def test_interrupted_trial_leaves_breaker_open(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=10)
+    fail(breaker)
+    clock.now += 10
+    with pytest.raises(KeyboardInterrupt):
+        with breaker:
+            raise KeyboardInterrupt
+    assert breaker.state == CircuitBreaker.OPEN
+    # The next call takes the trial
+    with breaker:
+        pass
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=2)
+    fail(breaker)
+    with breaker:
+        pass
+    fail(breaker)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_client_stops_calling_an_unreachable_node():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_time=60)
+    # Nothing listens on port 1
+    with OuroClient("http://127.0.0.1:1", retries=0, circuit_breaker=breaker) as client:
+        for _ in range(2):
+            with pytest.raises(NetworkError, match="Connection"):
+                client.get_balance("ouro1a")
+        with pytest.raises(NetworkError, match="circuit open"):
+            client.get_balance("ouro1a")
@@ -0,0 +1,54 @@
+"""TTLCache expiry, LRU bound and clearing"""
+
+import pytest
+
+from ouro_sdk import _cache
+from ouro_sdk._cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(_cache, "time", fake)
+    return fake
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(ttl=2.0)
+    cache.set("a", 1)
+    clock.now += 1.9
+    assert cache.get("a") == 1
+    clock.now += 0.1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+
+def test_clear_drops_everything(clock):
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.clear()
+    assert cache.get("a") is None
+
+
+@pytest.mark.parametrize("options", [{"ttl": 0}, {"maxsize": 0}])
+def test_zero_ttl_or_size_disables(clock, options):
+    cache = TTLCache(**options)
+    cache.set("a", 1)
+    assert cache.get("a") is None
@@ -0,0 +1,156 @@
+"""OuroClient behaviour against a local fake node"""
+
+import gzip
+
+import orjson
+import pytest
+
+from ouro_sdk import (
+    EventStreamUnsupportedError,
+    Microchain,
+    NetworkError,
+    OuroClient,
+    TransactionData,
+)
+
+
+def big_tx() -> TransactionData:
+    return TransactionData(
+        id="tx-1", from_addr="ouro1a", to="ouro1b", amount=5, nonce=0, signature="00",
+        data={"memo": "x" * 4096},
+    )
+
+
+def test_submit_is_not_gzipped_by_default(node):
+    node.route("POST", "/tx/submit", {"success": True, "tx_id": "tx-1"})
+    with OuroClient(node.url) as client:
+        assert client.submit_transaction(big_tx()) == "tx-1"
+    sent = node.requests[-1]
+    assert "Content-Encoding" not in sent.headers
+    assert orjson.loads(sent.body)["data"]["memo"] == "x" * 4096
+
+
+def test_submit_above_gzip_threshold_is_compressed(node):
+    node.route("POST", "/tx/submit", {"success": True, "tx_id": "tx-1"})
+    with OuroClient(node.url, gzip_threshold=1024) as client:
+        assert client.submit_transaction(big_tx()) == "tx-1"
+    sent = node.requests[-1]
+    assert sent.headers["Content-Encoding"] == "gzip"
+    assert sent.headers["Content-Type"] == "application/json"
+    assert len(sent.body) < 1024
+    assert orjson.loads(gzip.decompress(sent.body)) == big_tx().to_dict()
+
+
+def test_batch_lookup_keeps_read_cache(node):
+    node.route("GET", "/balance/ouro1a", {"balance": 10, "pending": 0})
+    node.route("POST", "/batch", {"responses": [{"result": {"balance": 7}}]})
+    with OuroClient(node.url) as client:
+        client.get_balance("ouro1a")
+        assert [b.balance for b in client.batch_get_balances(["ouro1b"])] == [7]
+        client.get_balance("ouro1a")
+    assert node.hits("GET", "/balance/ouro1a") == 1
+
+
+def test_submit_clears_read_cache(node):
+    node.route("GET", "/balance/ouro1a", {"balance": 10, "pending": 0}, {"balance": 5})
+    node.route("POST", "/tx/submit", {"success": True, "tx_id": "tx-1"})
+    with OuroClient(node.url) as client:
+        assert client.get_balance("ouro1a").balance == 10
+        client.submit_transaction(big_tx())
+        assert client.get_balance("ouro1a").balance == 5
+    assert node.hits("GET", "/balance/ouro1a") == 2
+
+
+@pytest.mark.parametrize("status", [404, 405])
+def test_batch_falls_back_to_single_lookups(node, status):
+    node.route("POST", "/batch", (status, "no batch"))
+    node.route("GET", "/balance/ouro1a", {"balance": 1})
+    node.route("GET", "/balance/ouro1b", {"balance": 2, "pending": 1})
+    with OuroClient(node.url) as client:
+        with pytest.warns(RuntimeWarning, match="falling back"):
+            balances = client.batch_get_balances(["ouro1a", "ouro1b"])
+    assert [(b.balance, b.pending) for b in balances] == [(1, 0), (2, 1)]
+    assert node.hits("POST", "/batch") == 1
+
+
+def test_batch_retries_failed_items_individually(node):
+    node.route(
+        "POST", "/batch",
+        {"responses": [{"result": {"status": "confirmed"}}, {"error": "busy"}]},
+    )
+    node.route("GET", "/tx/tx-2", {"status": "pending"})
+    with OuroClient(node.url) as client:
+        assert client.batch_get_transaction_status(["tx-1", "tx-2"]) == ["confirmed", "pending"]
+
+
+TXS = [
+    {"id": f"tx-{i}", "from": "ouro1a", "to": "ouro1b", "amount": i, "nonce": i, "signature": "00"}
+    for i in range(3)
+]
+
+
+def test_records_stream_as_ndjson(node):
+    body = "".join(orjson.dumps(tx).decode() + "\n" for tx in TXS)
+    node.route("GET", "/microchain/mc1/txs", (200, body, {"Content-Type": "application/x-ndjson"}))
+    with OuroClient(node.url) as client:
+        txs = list(Microchain("mc1", client, node.url).iter_tx_history(0, 10))
+    assert [tx.amount for tx in txs] == [0, 1, 2]
+    assert "application/x-ndjson" in node.requests[-1].headers["Accept"]
+    assert "from=0" in node.requests[-1].path
+
+
+def test_records_fall_back_to_plain_json(node):
+    node.route("GET", "/microchain/mc1/txs", {"transactions": TXS, "total": 3})
+    with OuroClient(node.url) as client:
+        txs = Microchain("mc1", client, node.url).tx_history(0, 10)
+    assert [tx.id for tx in txs] == ["tx-0", "tx-1", "tx-2"]
+
+
+def test_sse_joins_multi_line_data(node):
+    body = (
+        ": keep-alive\n\n"
+        "event: update\n"
+        'data: {"status":\n'
+        'data:  "confirmed",\n'
+        'data: "height": 4}\n'
+        "\n"
+        'data: {"status": "anchored"}\n\n'
+    )
+    node.route("GET", "/events/tx/tx-1", (200, body, {"Content-Type": "text/event-stream"}))
+    with OuroClient(node.url) as client:
+        events = list(client.stream_events("tx/tx-1"))
+    assert events == [{"status": "confirmed", "height": 4}, {"status": "anchored"}]
+
+
+def test_sse_unsupported_topic(node):
+    with OuroClient(node.url) as client:
+        with pytest.raises(EventStreamUnsupportedError):
+            list(client.stream_events("tx/tx-1"))
+
+
+@pytest.mark.parametrize(
+    "reply, sends",
+    [
+        ((503, "busy", {"Retry-After": "0"}), 2),
+        ((429, "slow down", {"Retry-After": "0"}), 2),
+        ((503, "busy"), 1),
+        ((500, "boom", {"Retry-After": "0"}), 1),
+        ((502, "bad gateway"), 1),
+    ],
+)
+def test_post_is_retried_only_when_node_turned_it_away(node, reply, sends):
+    node.route("POST", "/tx/submit", reply, {"success": True, "tx_id": "tx-1"})
+    with OuroClient(node.url) as client:
+        if sends == 2:
+            assert client.submit_transaction(big_tx()) == "tx-1"
+        else:
+            with pytest.raises(NetworkError):
+                client.submit_transaction(big_tx())
+    assert node.hits("POST", "/tx/submit") == sends
+
+
+def test_get_is_retried_on_server_errors(node):
+    node.route("GET", "/tx/tx-1", (500, "boom"), (502, "bad gateway"), {"status": "confirmed"})
+    with OuroClient(node.url) as client:
+        assert client.get_transaction_status("tx-1") == "confirmed"
+    assert node.hits("GET", "/tx/tx-1") == 3
@@ -0,0 +1,36 @@
+"""Subchain status watching"""
+
+import itertools
+import json
+
+from ouro_sdk import OuroClient, Subchain
+
+
+def status(state: str, block_height: int) -> dict:
+    return {
+        "id": "sc1", "name": "shop", "owner": "ouro1owner", "state": state,
+        "deposit_balance": 1000, "blocks_remaining": 50, "block_height": block_height,
+        "tx_count": 3, "validator_count": 1,
+    }
+
+
+def sse(*events: dict) -> tuple:
+    body = "".join(f"data: {json.dumps(e)}\n\n" for e in events)
+    return 200, body, {"Content-Type": "text/event-stream"}
+
+
+def test_watch_status_reconnects_after_stream_closes(node):
+    node.route(
+        "GET",
+        "/events/subchain/sc1/status",
+        sse(status("active", 1)),
+        # Reconnect replays the current status before the next change
+        sse(status("active", 1), status("grace_period", 2)),
+        (404, "no events"),
+    )
+    node.route("GET", "/subchain/sc1/status", status("terminated", 3))
+    with OuroClient(node.url) as client:
+        watch = Subchain("sc1", client, node.url, 0).watch_status(poll_interval=0)
+        seen = [(s.state.value, s.block_height) for s in itertools.islice(watch, 3)]
+    assert seen == [("active", 1), ("grace_period", 2), ("terminated", 3)]
+    assert node.hits("GET", "/events/subchain/sc1/status") == 3
@@ -0,0 +1,28 @@
+"""Transaction signing"""
+
+import nacl.signing
+import pytest
+
+from ouro_sdk import InvalidSignatureError, Signer, Transaction
+
+KEY = nacl.signing.SigningKey.generate()
+KEY_HEX = bytes(KEY).hex()
+
+
+def test_signer_matches_hex_key_signature():
+    tx = Transaction("ouro1a", "ouro1b", 5).with_nonce(3)
+    by_hex = tx.sign(KEY_HEX).signature
+    assert tx.sign(Signer(KEY_HEX)).signature == by_hex
+    KEY.verify_key.verify(tx._get_signing_message(), bytes.fromhex(by_hex))
+
+
+def test_signing_message_keeps_non_int_amounts():
+    tx = Transaction("ouro1a", "ouro1b", 1.5).with_nonce(2)
+    assert tx._get_signing_message() == f"{tx.id}:ouro1a:ouro1b:1.5:2".encode()
+
+
+def test_bad_key_raises_invalid_signature():
+    with pytest.raises(InvalidSignatureError):
+        Transaction("ouro1a", "ouro1b", 5).sign("not-hex")
+    with pytest.raises(InvalidSignatureError):
+        Signer("abcd")
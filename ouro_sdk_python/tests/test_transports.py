@@ -0,0 +1,27 @@
+"""Requests go out the same way on every transport"""
+
+import warnings
+
+import orjson
+import pytest
+
+from ouro_sdk import Microchain, OuroClient
+
+pytest.importorskip("httpx")
+
+
+@pytest.mark.parametrize("options", [{"transport": "httpx"}, {"http2": True}])
+def test_submit_over_httpx_sends_raw_body(node, options):
+    node.route("POST", "/microchain/mc1/tx", {"success": True, "tx_id": "tx-1"})
+    if options.get("http2"):
+        pytest.importorskip("h2")
+    with OuroClient(node.url, **options) as client:
+        chain = Microchain("mc1", client, node.url)
+        with warnings.catch_warnings():
+            # httpx deprecates data= for raw bytes
+            warnings.simplefilter("error")
+            assert chain.transfer("ouro1a", "ouro1b", 5) == "tx-1"
+    sent = node.requests[-1]
+    assert sent.headers["Content-Type"] == "application/json"
+    body = orjson.loads(sent.body)
+    assert (body["from"], body["to"], body["amount"]) == ("ouro1a", "ouro1b", 5)
@@ -0,0 +1,28 @@
+"""Response record types"""
+
+import msgspec
+import pytest
+
+from ouro_sdk import SubchainState, SubchainStatus, TransactionData
+
+
+def test_subchain_status_builds_positionally_in_dataclass_order():
+    status = SubchainStatus("sc1", "shop", "ouro1o", SubchainState.ACTIVE, 1000, 50, 7, 3, None, 1)
+    assert (status.block_height, status.last_anchor_height, status.validator_count) == (7, None, 1)
+
+
+def test_subchain_status_from_dict_without_anchor_height():
+    status = SubchainStatus.from_dict({
+        "id": "sc1", "name": "shop", "owner": "ouro1o", "state": "grace_period",
+        "deposit_balance": 1000, "blocks_remaining": 50, "block_height": 7,
+        "tx_count": 3, "validator_count": 1,
+    })
+    assert status.state is SubchainState.GRACE_PERIOD
+    assert status.last_anchor_height is None
+
+
+def test_records_are_frozen():
+    tx = TransactionData("tx-1", "ouro1a", "ouro1b", 5, 0, "00")
+    with pytest.raises(AttributeError):
+        tx.amount = 6
+    assert msgspec.structs.replace(tx, amount=6).amount == 6
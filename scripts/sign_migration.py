@@ -6,27 +6,56 @@ Signs SQL migration files with Ed25519 signatures.
 
 Usage:
     python sign_migration.py <migration_file> <private_key_hex>
+    python sign_migration.py --batch <glob> <private_key_hex>
 
 Example:
     python sign_migration.py migrations/001_create_users.sql $(cat migration_signing.key)
+    python sign_migration.py --batch "migrations/*.sql" $(cat migration_signing.key)
 
 Generates:
     migrations/001_create_users.sql.sig (64-byte signature file)
 """
 
+import os
 import sys
+import glob
 import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 try:
-    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
-    from cryptography.hazmat.primitives import serialization
+    from nacl.signing import SigningKey
 except ImportError:
-    print("ERROR: cryptography library not installed")
-    print("Install with: pip install cryptography")
+    print("ERROR: pynacl library not installed")
+    print("Install with: pip install pynacl")
     sys.exit(1)
 
 
+def load_private_key(private_key_hex: str) -> SigningKey:
+    """Parse a 32-byte hex Ed25519 private key."""
+    try:
+        private_key_bytes = bytes.fromhex(private_key_hex.strip())
+    except ValueError:
+        raise ValueError("Private key must be a valid hex string")
+
+    if len(private_key_bytes) != 32:
+        raise ValueError(f"Private key must be 32 bytes, got {len(private_key_bytes)}")
+
+    return SigningKey(private_key_bytes)
+
+
+def file_sha256(path: str) -> bytes:
+    """SHA-256 of a file, streamed so large migrations are never held in memory."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").digest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+        return h.digest()
+
+
 def sign_migration(migration_path: str, private_key_hex: str) -> bytes:
     """
     Sign a migration file with Ed25519.
@@ -43,25 +72,14 @@ def sign_migration(migration_path: str, private_key_hex: str) -> bytes:
     if not migration_file.exists():
         raise FileNotFoundError(f"Migration file not found: {migration_path}")
 
-    content = migration_file.read_bytes()
-
     # Hash the content (SHA-256)
-    content_hash = hashlib.sha256(content).digest()
+    content_hash = file_sha256(migration_path)
 
     # Parse private key
-    try:
-        private_key_bytes = bytes.fromhex(private_key_hex.strip())
-    except ValueError:
-        raise ValueError("Private key must be a valid hex string")
-
-    if len(private_key_bytes) != 32:
-        raise ValueError(f"Private key must be 32 bytes, got {len(private_key_bytes)}")
-
-    # Create Ed25519 private key
-    private_key = Ed25519PrivateKey.from_private_bytes(private_key_bytes)
+    private_key = load_private_key(private_key_hex)
 
     # Sign the hash
-    signature = private_key.sign(content_hash)
+    signature = private_key.sign(content_hash).signature
 
     print(f"✅ Signed migration: {migration_path}")
     print(f"   Content hash: {content_hash.hex()[:16]}...")
@@ -70,22 +88,86 @@ def sign_migration(migration_path: str, private_key_hex: str) -> bytes:
     return signature
 
 
+# Signing key of a sign_many() worker process, parsed once by _init_worker
+_worker_key: Optional[SigningKey] = None
+
+
+def _init_worker(private_key_hex: str) -> None:
+    global _worker_key
+    _worker_key = load_private_key(private_key_hex)
+
+
+def _sign_file(migration_path: str) -> Tuple[str, bytes]:
+    return migration_path, _worker_key.sign(file_sha256(migration_path)).signature
+
+
+def sign_many(
+    paths: List[str], private_key_hex: str, workers: Optional[int] = None
+) -> List[Tuple[str, bytes]]:
+    """
+    Hash and sign migration files across worker processes.
+
+    Each worker parses the key once and then hashes and signs whole files,
+    so throughput scales with cores. Nothing is written here.
+
+    Args:
+        paths: Paths to the SQL migration files
+        private_key_hex: Private key as hex string (64 characters = 32 bytes)
+        workers: Worker processes (default: CPU count); 1 signs in-process
+
+    Returns:
+        (path, 64-byte signature) tuples in the order of paths
+    """
+    # Fail on a bad key here rather than inside every worker
+    private_key = load_private_key(private_key_hex)
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+
+    if workers <= 1:
+        return [(p, private_key.sign(file_sha256(p)).signature) for p in paths]
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(private_key_hex,)
+    ) as pool:
+        chunksize = max(1, len(paths) // (workers * 4))
+        return list(pool.map(_sign_file, paths, chunksize=chunksize))
+
+
+def sign_migrations(
+    paths: List[str], private_key_hex: str, workers: Optional[int] = None
+) -> Dict[str, bytes]:
+    """
+    Sign many migration files and write their .sql.sig files.
+
+    Signing is spread over worker processes by sign_many().
+
+    Args:
+        paths: Paths to the SQL migration files
+        private_key_hex: Private key as hex string (64 characters = 32 bytes)
+        workers: Worker processes (default: CPU count)
+
+    Returns:
+        Mapping of migration path to its 64-byte signature
+    """
+    for migration_path in paths:
+        if not Path(migration_path).exists():
+            raise FileNotFoundError(f"Migration file not found: {migration_path}")
+
+    signatures = {}
+    for migration_path, signature in sign_many(paths, private_key_hex, workers):
+        Path(migration_path).with_suffix(".sql.sig").write_bytes(signature)
+        signatures[migration_path] = signature
+
+    print(f"✅ Signed {len(signatures)} migration(s)")
+    return signatures
+
+
 def generate_keypair():
     """Generate a new Ed25519 keypair for migration signing."""
-    private_key = Ed25519PrivateKey.generate()
-    public_key = private_key.public_key()
+    private_key = SigningKey.generate()
 
-    # Export keys
-    private_bytes = private_key.private_bytes(
-        encoding=serialization.Encoding.Raw,
-        format=serialization.PrivateFormat.Raw,
-        encryption_algorithm=serialization.NoEncryption()
-    )
-
-    public_bytes = public_key.public_bytes(
-        encoding=serialization.Encoding.Raw,
-        format=serialization.PublicFormat.Raw
-    )
+    # Export keys (raw 32-byte seed and public key)
+    private_bytes = bytes(private_key)
+    public_bytes = bytes(private_key.verify_key)
 
     print("=== NEW MIGRATION SIGNING KEYPAIR ===")
     print()
@@ -106,10 +188,12 @@ def main():
     if len(sys.argv) < 2:
         print("Usage:")
         print("  Sign migration:    python sign_migration.py <migration_file> <private_key_hex>")
+        print("  Sign many:         python sign_migration.py --batch <glob> <private_key_hex>")
         print("  Generate keypair:  python sign_migration.py --generate")
         print()
         print("Examples:")
         print("  python sign_migration.py migrations/001_init.sql abc123...")
+        print('  python sign_migration.py --batch "migrations/*.sql" abc123...')
         print("  python sign_migration.py --generate")
         sys.exit(1)
 
@@ -117,6 +201,24 @@ def main():
         generate_keypair()
         return
 
+    if sys.argv[1] == "--batch":
+        if len(sys.argv) < 4:
+            print("ERROR: Missing glob or private key argument")
+            print("Usage: python sign_migration.py --batch <glob> <private_key_hex>")
+            sys.exit(1)
+
+        paths = sorted(glob.glob(sys.argv[2]))
+        if not paths:
+            print(f"ERROR: No migration files match {sys.argv[2]}")
+            sys.exit(1)
+
+        try:
+            sign_migrations(paths, sys.argv[3])
+        except Exception as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        return
+
     if len(sys.argv) < 3:
         print("ERROR: Missing private key argument")
         print("Usage: python sign_migration.py <migration_file> <private_key_hex>")
@@ -1,15 +1,60 @@
 """Ouroboros node HTTP client — sync and async variants."""
 
+import asyncio
+import http.client
 import json
 import os
-import urllib.error
-import urllib.request
-from typing import Any, Dict, Optional
+import select
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import httpx
+    import numpy
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # pip install ouro-sdk[fast] for the C parser
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    import requests
+except ImportError:  # stdlib http.client fallback keeps the SDK dependency-free
+    requests = None
+
+# Raised when a kept-alive connection was closed by the node between calls
+_STALE_CONNECTION = (BrokenPipeError, ConnectionResetError, http.client.RemoteDisconnected)
+
+
+def _transfer_body(from_addr: str, to_addr: str, amount: int) -> bytes:
+    # Template the fixed keys; every value still goes through the JSON encoder
+    return b'{"from":%s,"to":%s,"amount":%s}' % (
+        _dumps(from_addr), _dumps(to_addr), _dumps(amount)
+    )
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    """True if an idle kept-alive socket turned readable, i.e. the node closed it."""
+    if conn.sock is None:
+        return False
+    return bool(select.select([conn.sock], [], [], 0)[0])
 
 
 class OuroClient:
     """
-    Synchronous Ouroboros node client. Uses stdlib urllib — no dependencies required.
+    Synchronous Ouroboros node client. Uses stdlib http.client — no dependencies required.
+
+    Connections are kept alive between calls. When ``requests`` is installed
+    (``pip install ouro-sdk[requests]``) they are pooled by a ``requests.Session``
+    instead. Release them with ``close()`` or a ``with`` block.
 
     Example::
 
@@ -32,86 +77,170 @@ class OuroClient:
     ):
         self.api_url = api_url.rstrip("/")
         self.api_key = api_key or os.getenv("OURO_API_KEY")
+        # Fixed for the client's lifetime; built once and shared read-only
+        self._header_cache = {"Content-Type": "application/json", "Accept": "application/json"}
+        if self.api_key:
+            self._header_cache["Authorization"] = f"Bearer {self.api_key}"
+        self._session: Optional["requests.Session"] = None
+        if requests is not None:
+            self._session = requests.Session()
+            self._session.headers.update(self._headers())
+        # http.client fallback: idle persistent connections, checked out one per call
+        parts = urllib.parse.urlsplit(self.api_url)
+        self._conn_cls = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host, self._port, self._base_path = parts.hostname, parts.port, parts.path
+        self._idle: List[http.client.HTTPConnection] = []
+        self._idle_lock = threading.Lock()
+        # Request targets built once: full URLs for requests, paths for http.client
+        self._prefix = self.api_url if self._session is not None else self._base_path
+        self._url_health = self._prefix + "/health"
+        self._url_identity = self._prefix + "/identity"
+        self._url_consensus = self._prefix + "/consensus"
+        self._url_peers = self._prefix + "/peers"
+        self._url_metrics = self._prefix + "/metrics/json"
+        self._url_resources = self._prefix + "/resources"
+        self._url_mempool = self._prefix + "/mempool"
+        self._url_network_stats = self._prefix + "/network/stats"
+        self._url_submit = self._prefix + "/tx/submit"
+        self._url_transfer = self._prefix + "/ouro/transfer"
+        self._prefix_balance = self._prefix + "/ouro/balance/"
+        self._prefix_nonce = self._prefix + "/ouro/nonce/"
+        self._prefix_tx = self._prefix + "/tx/"
 
     def _headers(self) -> Dict[str, str]:
-        h = {"Content-Type": "application/json", "Accept": "application/json"}
-        if self.api_key:
-            h["Authorization"] = f"Bearer {self.api_key}"
-        return h
+        return self._header_cache
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        if self._session is not None:
+            self._session.close()
+        with self._idle_lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def _send(self, method: str, target: str, body: Optional[bytes] = None) -> Any:
+        """Send over an idle kept-alive connection, reconnecting once if it went stale."""
+        with self._idle_lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is not None and _is_dropped(conn):
+            conn.close()
+        if conn is None:
+            conn = self._conn_cls(self._host, self._port, timeout=10)
+        headers = self._header_cache
+        try:
+            resent = False
+            try:
+                conn.request(method, target, body=body, headers=headers)
+            except _STALE_CONNECTION:
+                # Nothing reached the node, so any method can be resent
+                conn.close()
+                conn.request(method, target, body=body, headers=headers)
+                resent = True
+            try:
+                resp = conn.getresponse()
+            except _STALE_CONNECTION:
+                # The node may already have applied a POST; only a GET is safe to repeat
+                if resent or method != "GET":
+                    raise
+                conn.close()
+                conn.request(method, target, body=body, headers=headers)
+                resp = conn.getresponse()
+            data = resp.read()
+        except BaseException:
+            # Mid-request failure leaves the connection unusable
+            conn.close()
+            raise
+        with self._idle_lock:
+            self._idle.append(conn)
+        if resp.status >= 400:
+            text = data.decode("utf-8", errors="replace")
+            raise RuntimeError(f"{method} {target} failed: HTTP {resp.status} {text}")
+        return _loads(data)
+
+    def __enter__(self) -> "OuroClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _result(method: str, path: str, resp: "requests.Response") -> Any:
+        if resp.status_code >= 400:
+            raise RuntimeError(f"{method} {path} failed: HTTP {resp.status_code} {resp.text}")
+        return _loads(resp.content)
+
+    def _get_url(self, url: str) -> Any:
+        """GET a target built from self._prefix."""
+        if self._session is not None:
+            return self._result("GET", url, self._session.get(url, timeout=10))
+        return self._send("GET", url)
+
+    def _post_url(self, url: str, body: dict) -> Any:
+        """POST to a target built from self._prefix."""
+        return self._post_bytes(url, _dumps(body))
+
+    def _post_bytes(self, url: str, body: bytes) -> Any:
+        """POST an already-encoded JSON body to a target built from self._prefix."""
+        if self._session is not None:
+            return self._result("POST", url, self._session.post(url, data=body, timeout=10))
+        return self._send("POST", url, body)
 
     def _get(self, path: str) -> Any:
-        req = urllib.request.Request(
-            f"{self.api_url}{path}", headers=self._headers()
-        )
-        try:
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                return json.loads(resp.read())
-        except urllib.error.HTTPError as e:
-            body = e.read().decode("utf-8", errors="replace")
-            raise RuntimeError(f"GET {path} failed: HTTP {e.code} {body}") from e
+        return self._get_url(self._prefix + path)
 
     def _post(self, path: str, body: dict) -> Any:
-        data = json.dumps(body).encode()
-        req = urllib.request.Request(
-            f"{self.api_url}{path}",
-            data=data,
-            headers=self._headers(),
-            method="POST",
-        )
-        try:
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                return json.loads(resp.read())
-        except urllib.error.HTTPError as e:
-            body = e.read().decode("utf-8", errors="replace")
-            raise RuntimeError(f"POST {path} failed: HTTP {e.code} {body}") from e
+        return self._post_url(self._prefix + path, body)
 
     # ─── Public endpoints ──────────────────────────────────────────────
 
     def health(self) -> dict:
         """GET /health — Node liveness."""
-        return self._get("/health")
+        return self._get_url(self._url_health)
 
     def identity(self) -> dict:
         """GET /identity — Node ID, role, uptime, version."""
-        return self._get("/identity")
+        return self._get_url(self._url_identity)
 
     def consensus(self) -> dict:
         """GET /consensus — Current view, leader, QC, last block."""
-        return self._get("/consensus")
+        return self._get_url(self._url_consensus)
 
     def peers(self) -> dict:
         """GET /peers — Connected peer list."""
-        return self._get("/peers")
+        return self._get_url(self._url_peers)
 
     def balance(self, address: str) -> dict:
         """GET /ouro/balance/:address — OURO coin balance."""
-        return self._get(f"/ouro/balance/{address}")
+        return self._get_url(self._prefix_balance + address)
 
     def nonce(self, address: str) -> dict:
         """GET /ouro/nonce/:address — Account nonce."""
-        return self._get(f"/ouro/nonce/{address}")
+        return self._get_url(self._prefix_nonce + address)
 
     # ─── Protected endpoints ───────────────────────────────────────────
 
     def metrics(self) -> dict:
         """GET /metrics/json — TPS, block height, sync %, mempool, etc."""
-        return self._get("/metrics/json")
+        return self._get_url(self._url_metrics)
 
     def resources(self) -> dict:
         """GET /resources — CPU, memory, disk usage."""
-        return self._get("/resources")
+        return self._get_url(self._url_resources)
 
     def mempool(self) -> dict:
         """GET /mempool — Current mempool."""
-        return self._get("/mempool")
+        return self._get_url(self._url_mempool)
 
     def network_stats(self) -> dict:
         """GET /network/stats — Network statistics."""
-        return self._get("/network/stats")
+        return self._get_url(self._url_network_stats)
 
     def get_transaction(self, tx_id: str) -> dict:
         """GET /tx/:id — Get transaction by UUID or hash."""
-        return self._get(f"/tx/{tx_id}")
+        return self._get_url(self._prefix_tx + tx_id)
 
     def submit_transaction(self, tx: dict) -> dict:
         """
@@ -121,7 +250,7 @@ class OuroClient:
             tx: dict with keys: sender, recipient, amount (nanoouro),
                 optionally: signature (hex), nonce, idempotency_key
         """
-        return self._post("/tx/submit", tx)
+        return self._post_bytes(self._url_submit, _dumps(tx))
 
     def transfer(self, from_addr: str, to_addr: str, amount: int) -> dict:
         """
@@ -132,36 +261,66 @@ class OuroClient:
             to_addr: recipient address
             amount: amount in nanoouro (1 OURO = 1,000,000,000)
         """
-        return self._post("/ouro/transfer", {"from": from_addr, "to": to_addr, "amount": amount})
+        return self._post_bytes(self._url_transfer, _transfer_body(from_addr, to_addr, amount))
 
     # ─── Convenience ──────────────────────────────────────────────────
 
     def status(self) -> dict:
         """Combined snapshot: health + identity + consensus + metrics. Never raises."""
+        # The four lookups are independent: wait for the slowest, not their sum
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            futures = {
+                k: ex.submit(getattr(self, k))
+                for k in ("health", "identity", "consensus", "metrics")
+            }
         result: dict = {"online": False}
-        try:
-            result["health"] = self.health()
-            result["online"] = True
-            result["identity"] = self.identity()
-            result["consensus"] = self.consensus()
-            result["metrics"] = self.metrics()
-        except Exception as e:
-            result["error"] = str(e)
+        for key, future in futures.items():
+            try:
+                result[key] = future.result()
+            except Exception as e:
+                result.setdefault("error", str(e))
+        result["online"] = "health" in result
         return result
 
+    def mempool_arrays(self) -> Dict[str, "numpy.ndarray"]:
+        """
+        GET /mempool as int64 columns: ``{"amounts": ..., "nonces": ...}``.
+
+        Requires numpy (``pip install ouro-sdk[numpy]``). Transactions without
+        a nonce get -1.
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError(
+                "mempool_arrays requires numpy. Install it with: "
+                "pip install ouro-sdk[numpy]"
+            ) from e
+        txs = self.mempool().get("transactions", [])
+        n = len(txs)
+        return {
+            "amounts": np.fromiter((tx["amount"] for tx in txs), dtype=np.int64, count=n),
+            "nonces": np.fromiter((tx.get("nonce", -1) for tx in txs), dtype=np.int64, count=n),
+        }
+
 
 class AsyncOuroClient:
     """
     Async Ouroboros node client. Requires ``httpx`` (``pip install ouro-sdk[async]``).
 
+    One ``httpx.AsyncClient`` is created on the first request and reused for
+    every call after it, keeping connections (HTTP/2 when ``h2`` is installed)
+    alive between requests. Release it with ``await client.aclose()`` or by
+    using the client as an async context manager.
+
     Example::
 
         from ouro_sdk import AsyncOuroClient
 
         async def main():
-            client = AsyncOuroClient("http://localhost:8000", api_key="ouro_abc123")
-            health = await client.health()
-            balance = await client.balance("ouro1myaddress")
+            async with AsyncOuroClient("http://localhost:8000", api_key="ouro_abc123") as client:
+                health = await client.health()
+                balance = await client.balance("ouro1myaddress")
     """
 
     def __init__(
@@ -170,70 +329,126 @@ class AsyncOuroClient:
         api_key: Optional[str] = None,
     ):
         try:
-            import httpx  # noqa: F401
+            import httpx
         except ImportError as e:
             raise ImportError(
                 "AsyncOuroClient requires httpx. Install it with: "
                 "pip install ouro-sdk[async]"
             ) from e
+        try:
+            import h2  # noqa: F401
+            self._http2 = True
+        except ImportError:
+            self._http2 = False
+        self._httpx = httpx
         self.api_url = api_url.rstrip("/")
         self.api_key = api_key or os.getenv("OURO_API_KEY")
+        # Fixed for the client's lifetime; built once and shared read-only
+        self._header_cache = {"Content-Type": "application/json", "Accept": "application/json"}
+        if self.api_key:
+            self._header_cache["Authorization"] = f"Bearer {self.api_key}"
+        self._client: Optional["httpx.AsyncClient"] = None
+        # Full URLs built once so each call skips string formatting
+        self._url_health = self.api_url + "/health"
+        self._url_identity = self.api_url + "/identity"
+        self._url_consensus = self.api_url + "/consensus"
+        self._url_peers = self.api_url + "/peers"
+        self._url_metrics = self.api_url + "/metrics/json"
+        self._url_resources = self.api_url + "/resources"
+        self._url_mempool = self.api_url + "/mempool"
+        self._url_network_stats = self.api_url + "/network/stats"
+        self._url_submit = self.api_url + "/tx/submit"
+        self._url_transfer = self.api_url + "/ouro/transfer"
+        self._prefix_balance = self.api_url + "/ouro/balance/"
+        self._prefix_nonce = self.api_url + "/ouro/nonce/"
+        self._prefix_tx = self.api_url + "/tx/"
 
     def _headers(self) -> Dict[str, str]:
-        h = {"Content-Type": "application/json", "Accept": "application/json"}
-        if self.api_key:
-            h["Authorization"] = f"Bearer {self.api_key}"
-        return h
+        return self._header_cache
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        if self._client is None:
+            httpx = self._httpx
+            # No lower cap for HTTP/2: a node that only speaks HTTP/1.1 over TLS
+            # still needs parallel connections, and once h2 is negotiated httpx
+            # multiplexes over the open connection by itself
+            self._client = httpx.AsyncClient(
+                base_url=self.api_url,
+                headers=self._headers(),
+                timeout=10,
+                http2=self._http2,
+                limits=httpx.Limits(max_keepalive_connections=32),
+            )
+        return self._client
+
+    async def prewarm(self) -> None:
+        """
+        Open the pooled connection (TCP/TLS handshake) before a hot loop.
+
+        When the node negotiates HTTP/2, later concurrent calls such as
+        status() multiplex over this connection instead of each opening one.
+        """
+        # Any HTTP response means the connection is up; only transport errors raise
+        await self._get_client().get(self._url_health)
+
+    async def aclose(self) -> None:
+        """Close the pooled connections. The client reconnects if used again."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncOuroClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _get_url(self, url: str) -> Any:
+        resp = await self._get_client().get(url)
+        resp.raise_for_status()
+        return _loads(resp.content)
+
+    async def _post_url(self, url: str, body: dict) -> Any:
+        return await self._post_bytes(url, _dumps(body))
+
+    async def _post_bytes(self, url: str, body: bytes) -> Any:
+        resp = await self._get_client().post(url, content=body)
+        resp.raise_for_status()
+        return _loads(resp.content)
 
     async def _get(self, path: str) -> Any:
-        import httpx
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.api_url}{path}", headers=self._headers(), timeout=10
-            )
-            resp.raise_for_status()
-            return resp.json()
+        return await self._get_url(self.api_url + path)
 
     async def _post(self, path: str, body: dict) -> Any:
-        import httpx
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{self.api_url}{path}",
-                json=body,
-                headers=self._headers(),
-                timeout=10,
-            )
-            resp.raise_for_status()
-            return resp.json()
-
-    async def health(self) -> dict:        return await self._get("/health")
-    async def identity(self) -> dict:      return await self._get("/identity")
-    async def consensus(self) -> dict:     return await self._get("/consensus")
-    async def peers(self) -> dict:         return await self._get("/peers")
-    async def metrics(self) -> dict:       return await self._get("/metrics/json")
-    async def resources(self) -> dict:     return await self._get("/resources")
-    async def mempool(self) -> dict:       return await self._get("/mempool")
-    async def network_stats(self) -> dict: return await self._get("/network/stats")
+        return await self._post_url(self.api_url + path, body)
+
+    async def health(self) -> dict:        return await self._get_url(self._url_health)
+    async def identity(self) -> dict:      return await self._get_url(self._url_identity)
+    async def consensus(self) -> dict:     return await self._get_url(self._url_consensus)
+    async def peers(self) -> dict:         return await self._get_url(self._url_peers)
+    async def metrics(self) -> dict:       return await self._get_url(self._url_metrics)
+    async def resources(self) -> dict:     return await self._get_url(self._url_resources)
+    async def mempool(self) -> dict:       return await self._get_url(self._url_mempool)
+    async def network_stats(self) -> dict: return await self._get_url(self._url_network_stats)
 
     async def balance(self, address: str) -> dict:
-        return await self._get(f"/ouro/balance/{address}")
+        return await self._get_url(self._prefix_balance + address)
 
     async def nonce(self, address: str) -> dict:
-        return await self._get(f"/ouro/nonce/{address}")
+        return await self._get_url(self._prefix_nonce + address)
 
     async def get_transaction(self, tx_id: str) -> dict:
-        return await self._get(f"/tx/{tx_id}")
+        return await self._get_url(self._prefix_tx + tx_id)
 
     async def submit_transaction(self, tx: dict) -> dict:
-        return await self._post("/tx/submit", tx)
+        return await self._post_bytes(self._url_submit, _dumps(tx))
 
     async def transfer(self, from_addr: str, to_addr: str, amount: int) -> dict:
-        return await self._post(
-            "/ouro/transfer", {"from": from_addr, "to": to_addr, "amount": amount}
+        return await self._post_bytes(
+            self._url_transfer, _transfer_body(from_addr, to_addr, amount)
         )
 
     async def status(self) -> dict:
-        import asyncio
         results = await asyncio.gather(
             self.health(), self.identity(), self.consensus(), self.metrics(),
             return_exceptions=True,
@@ -0,0 +1,106 @@
+"""Tests for OuroClient's stdlib http.client transport against a local server"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ouro_sdk import client as client_module
+from ouro_sdk.client import OuroClient
+
+
+class Node(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # (method, path, client port) of every request read
+    hits: list = []
+    # Paths whose next request is read and then dropped without a reply
+    drop_once: set = set()
+    # Close each connection after replying, without telling the client
+    close_after_reply = False
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.hits.append((self.command, self.path, self.client_address[1]))
+        if self.path in self.drop_once:
+            self.drop_once.discard(self.path)
+            self.close_connection = True
+            return
+        out = json.dumps({"path": self.path, "body": body.decode()}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+        self.close_connection = self.close_after_reply
+
+    do_GET = do_POST = _handle
+
+
+@pytest.fixture
+def node(monkeypatch):
+    # Force the http.client transport even when requests is installed
+    monkeypatch.setattr(client_module, "requests", None)
+    Node.hits, Node.drop_once, Node.close_after_reply = [], set(), False
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Node)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_base_path_prefixes_every_target(node):
+    with OuroClient(node + "/api/") as client:
+        assert client.health()["path"] == "/api/health"
+        assert client.balance("ouro1abc")["path"] == "/api/ouro/balance/ouro1abc"
+        assert client.transfer("a", "b", 5)["path"] == "/api/ouro/transfer"
+    assert [path for _, path, _ in Node.hits] == [
+        "/api/health", "/api/ouro/balance/ouro1abc", "/api/ouro/transfer",
+    ]
+
+
+def test_connection_is_kept_alive(node):
+    with OuroClient(node) as client:
+        client.health()
+        client.health()
+        client.transfer("a", "b", 1)
+    assert len({port for _, _, port in Node.hits}) == 1
+
+
+def test_transfer_body_is_json(node):
+    with OuroClient(node) as client:
+        echoed = client.transfer('a"b', "c", 1.5)["body"]
+    assert json.loads(echoed) == {"from": 'a"b', "to": "c", "amount": 1.5}
+
+
+def test_connection_closed_by_node_is_replaced(node):
+    Node.close_after_reply = True
+    with OuroClient(node) as client:
+        client.health()
+        time.sleep(0.05)  # let the close reach the client before it reuses the connection
+        client.transfer("a", "b", 1)
+        time.sleep(0.05)
+        client.health()
+    assert [method for method, _, _ in Node.hits] == ["GET", "POST", "GET"]
+
+
+def test_get_is_resent_after_dropped_reply(node):
+    Node.drop_once.add("/health")
+    with OuroClient(node) as client:
+        assert client.health()["path"] == "/health"
+    assert [path for _, path, _ in Node.hits] == ["/health", "/health"]
+
+
+def test_post_is_not_resent_after_dropped_reply(node):
+    Node.drop_once.add("/ouro/transfer")
+    with OuroClient(node) as client:
+        with pytest.raises(ConnectionError):
+            client.transfer("a", "b", 1)
+        # The failed connection was discarded; the client keeps working
+        assert client.health()["path"] == "/health"
+    assert [path for _, path, _ in Node.hits] == ["/ouro/transfer", "/health"]